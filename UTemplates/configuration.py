@@ -1,58 +1,89 @@
 import os
-import json
+import sys
 import importlib
+import threading
+from functools import lru_cache
 from types import ModuleType
+from typing import (Any, Callable)
+
+# Annotated up front so either JSON parser can be bound to the name.
+_json_loads: Callable[[bytes], Any]
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 
 DEFAULT_CONFIG_PATH: str = "utemplates_config.json"
 ENV_CONFIG_PATH: str = "UTEMPLATES_CONFIG_PATH"
 
 
+@lru_cache(maxsize=None)
+def _cached_import(module_path: str, function_name: str) -> any:
+    """
+    Import a module and return one of its attributes, caching the result.
+    Modules that are already imported are taken from `sys.modules` without entering the import machinery.
+    """
+    module: ModuleType | None = sys.modules.get(module_path)
+    if module is None:
+        module = importlib.import_module(module_path)
+    return getattr(module, function_name)
+
+
 class ConfigurationManager:
     """A manager class to handle the loading and storage of conversion functions from a configuration file."""
-    _conversion_functions: list = None
+    _conversion_functions: list | None = None
+    _load_lock: threading.Lock = threading.Lock()
 
     @classmethod
-    def _load_config(cls) -> None:
+    def _load_config(cls) -> list:
         """
         A private method to load conversion functions from the configuration file.
         The configuration file's path is first searched in the environment variable `ENV_CONFIG_PATH`.
         If not found, it falls back to the `DEFAULT_CONFIG_PATH`.
+        Returns:
+            list: The loaded conversion functions, which are also stored on the class.
         """
         config_path: str = os.environ.get(ENV_CONFIG_PATH, DEFAULT_CONFIG_PATH)
-        if not os.path.exists(config_path):
+        try:
+            f = open(config_path, 'rb')
+        except FileNotFoundError:
             print("UTemplates is starting without a config file")
             if config_path == DEFAULT_CONFIG_PATH:
-                cls._conversion_functions: list = []
-            else:
-                raise ValueError(f"Config file not found at {config_path}")
+                cls._conversion_functions = []
+                return cls._conversion_functions
+            raise ValueError(f"Config file not found at {config_path}")
         print(f"UTemplates is starting with the following config path: {config_path}")
 
-        with open(config_path, 'r') as f:
-            config: dict[str, any] = json.load(f)
+        with f:
+            config: dict = _json_loads(f.read())
 
         conversion_functions: list = []
         for function_path in config.get("conversions", []):
-            parts: list[str] = function_path.split('.')
-            module_path: str = '.'.join(parts[:-1])
-            function_name: str = parts[-1]
-
-            module: ModuleType = importlib.import_module(module_path)
-            function = getattr(module, function_name)
-            conversion_functions.append(function)
+            module_path, _, function_name = function_path.rpartition('.')
+            if not module_path:
+                raise ValueError(f"Conversion function path must be a dotted path, got {function_path!r}")
+            conversion_functions.append(_cached_import(module_path, function_name))
 
-        cls._conversion_functions: list = conversion_functions
+        cls._conversion_functions = conversion_functions
         print(f"UTemplates is running with the following list of conversion functions: ")
-        print([func.__name__ for func in cls._conversion_functions])
+        print([func.__name__ for func in conversion_functions])
+        return conversion_functions
 
     @classmethod
     def get_conversion_functions(cls) -> list:
         """
         Public method to fetch the loaded conversion functions.
         If the functions haven't been loaded yet, it triggers the loading process.
+        The loading process is guarded by a lock so it runs only once even when several threads ask at the same time.
         Returns:
             list: A list of loaded conversion functions.
         """
-        if cls._conversion_functions is None:
-            cls._load_config()
-        return cls._conversion_functions
+        conversion_functions: list | None = cls._conversion_functions
+        if conversion_functions is not None:
+            return conversion_functions
+        with cls._load_lock:
+            conversion_functions = cls._conversion_functions
+            if conversion_functions is None:
+                conversion_functions = cls._load_config()
+            return conversion_functions
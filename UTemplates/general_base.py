@@ -1,8 +1,21 @@
 from abc import (ABC, abstractmethod)
-from typing import Iterable
+from typing import (TYPE_CHECKING, Any, Callable, Iterable, IO)
 
+if TYPE_CHECKING:
+    from _typeshed import IdentityFunction
 
+try:
+    from mypy_extensions import mypyc_attr
+except ImportError:
+    def mypyc_attr(*attrs: str, **kwattrs: object) -> "IdentityFunction":
+        """Stand-in for mypy_extensions.mypyc_attr when mypy_extensions is not installed."""
+        return lambda cls: cls
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
 class GeneralBaseElement(ABC):
+    __slots__ = ()
+
     def __str__(self) -> str:
         """
         Return the HTML element as a string.
@@ -38,18 +51,73 @@ class GeneralBaseElement(ABC):
         """
         pass
 
+    def write(self, out: IO[str]) -> None:
+        """
+        Write the HTML element to a text stream.
 
+        General Use Case:
+            This method streams the element into a file or buffer by passing the
+            stream's write method to render_to.
+
+        Example:
+            with open("page.html", "w", encoding="utf-8") as f:
+                my_element.write(f)
+
+        :param out: A text stream with a write method, e.g. an open file or io.StringIO.
+        """
+        self.render_to(out.write)
+
+    def render_to(self, write: Callable[[str], any]) -> None:
+        """
+        Render the HTML element into a sink callable.
+
+        General Use Case:
+            This method hands the rendered output to any callable that accepts strings,
+            such as a response object's write method. The default implementation passes
+            the result of to_string; subclasses may override it to emit their output in pieces.
+
+        Example:
+            my_element.render_to(response.write)
+
+        :param write: Callable receiving the rendered output, possibly in several pieces.
+        """
+        write(self.to_string())
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
 class GroupedBaseElement(GeneralBaseElement):
-    def __init__(self, elements: Iterable[GeneralBaseElement] | GeneralBaseElement) -> None:
+    __slots__ = ("elements",)
+
+    def __init__(self, elements: Iterable[Any] | GeneralBaseElement) -> None:
         """
         Initialize with an iterable of elements.
 
         :param elements: An iterable containing the elements to concatenate.
         """
-        self.elements: Iterable[GeneralBaseElement] | GeneralBaseElement = elements
+        self.elements: Iterable[Any] | GeneralBaseElement = elements
 
-    def to_string(self) -> str:
-        if isinstance(self.elements, GeneralBaseElement):
-            return str(self.elements)
+    def to_string(self, _str=str, _isinstance=isinstance) -> str:
+        elements: Iterable[Any] | GeneralBaseElement = self.elements
+        if isinstance(elements, GeneralBaseElement):
+            return elements.to_string()
         else:
-            return "".join(map(str, self.elements))
+            return "".join([
+                element.to_string() if _isinstance(element, GeneralBaseElement) else _str(element)
+                for element in elements
+            ])
+
+    def render_to(self, write: Callable[[str], any]) -> None:
+        """
+        Render each element into a sink callable in turn, without joining them first.
+
+        :param write: Callable receiving the rendered output, possibly in several pieces.
+        """
+        elements: Iterable[Any] | GeneralBaseElement = self.elements
+        if isinstance(elements, GeneralBaseElement):
+            elements.render_to(write)
+            return
+        for element in elements:
+            if isinstance(element, GeneralBaseElement):
+                element.render_to(write)
+            else:
+                write(str(element))
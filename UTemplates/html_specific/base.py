@@ -1,10 +1,159 @@
-import html
-from ..general_base import GeneralBaseElement
+from functools import lru_cache
+from sys import intern
+from typing import (Any, Callable, Iterable, TypeVar)
+from ..configuration import ConfigurationManager
+from ..general_base import (GeneralBaseElement, mypyc_attr)
 from ..utils import convert_value
 
 
+# Standard attribute keys, interned so the dict probes in BaseHTMLElement.__init__ compare by identity.
+_ID, _CLASS, _STYLE, _TITLE, _LANG, _DIR, _TABINDEX, _CONTENT = [
+    intern(key) for key in ("id", "class", "style", "title", "lang", "dir", "tabindex", "content")
+]
+
+
+def _escape(value: str) -> str:
+    """
+    Escape the HTML special characters of a string.
+
+    Most text contains none of them, so the string is first scanned for each special character
+    with the substring search, which is much faster than translating it character by character.
+    Only strings that need escaping are rewritten.
+
+    :param value: The string to escape.
+    :return: The escaped string, equivalent to html.escape(value).
+    """
+    if "&" in value or "<" in value or ">" in value or '"' in value or "'" in value:
+        return value.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;") \
+            .replace('"', "&quot;").replace("'", "&#x27;")
+    return value
+
+
+# Keyword argument names mapped to the HTML attribute names they stand for. A name is translated and interned
+# the first time it is used, so later elements only pay one dict lookup per keyword attribute.
+_ATTRIBUTE_NAMES: dict[str, str] = {}
+
+
+def _attribute_name(key: str) -> str:
+    """
+    Translate a keyword argument name into an HTML attribute name and remember the result.
+
+    :param key: The keyword argument name, e.g. "data_id".
+    :return: The interned attribute name, e.g. "data-id".
+    """
+    name: str = intern(key.replace("_", "-"))
+    _ATTRIBUTE_NAMES[key] = name
+    return name
+
+
+# Tag names seen so far, mapped to their interned form.
+_TAG_NAMES: dict[str, str] = {}
+# Attribute-less opening tags and closing tags of the tag names seen so far, built once per tag name.
+_OPEN_TAGS: dict[str, str] = {}
+_CLOSE_TAGS: dict[str, str] = {}
+
+
+def _tag_name(tag_name: str) -> str:
+    """
+    Intern an identifier-like tag name and remember it, along with its bare opening and closing tags.
+
+    Only identifier-like names are interned so free text, such as comment tags, is not kept alive.
+
+    :param tag_name: The tag name passed to BaseHTMLElement.
+    :return: The interned tag name, or the tag name unchanged if it is not identifier-like.
+    """
+    if type(tag_name) is not str or not tag_name.isidentifier():
+        return tag_name
+    name: str = intern(tag_name)
+    _TAG_NAMES[name] = name
+    _OPEN_TAGS[name] = f"<{name}>"
+    _CLOSE_TAGS[name] = f"</{name}>"
+    return name
+
+
+# Shared instances of the classes that hand out one instance when created without arguments, keyed by class.
+# Kept at module level because compiled (mypyc) classes cannot have class attributes assigned at runtime.
+_SHARED_INSTANCES: dict[type, Any] = {}
+_SharedT = TypeVar("_SharedT", bound="BaseHTMLElement")
+
+
+def _shared_instance(cls: type[_SharedT]) -> _SharedT | None:
+    """
+    Return the shared instance of a class whose argument-less instances are shared, if it exists yet.
+
+    Used by __new__ of such classes. Their __init__ skips initialisation when _is_shared_instance
+    is True and calls _register_shared_instance once the instance is initialised.
+
+    :param cls: The class being instantiated.
+    :return: The shared instance, or None if none has been created.
+    """
+    return _SHARED_INSTANCES.get(cls)
+
+
+def _is_shared_instance(instance: "BaseHTMLElement") -> bool:
+    """
+    Tell whether an instance is the already initialised shared instance of its class.
+
+    :param instance: The instance being initialised.
+    :return: True if __init__ should leave the instance untouched.
+    """
+    return _SHARED_INSTANCES.get(type(instance)) is instance
+
+
+def _register_shared_instance(instance: "BaseHTMLElement") -> None:
+    """
+    Make an initialised instance the frozen shared instance of its class, unless the class already has one.
+
+    :param instance: The freshly initialised instance.
+    """
+    if _SHARED_INSTANCES.setdefault(type(instance), instance) is instance:
+        instance._frozen = True
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _shared_element(element_type: type, content: any = None, **kwargs) -> "BaseHTMLElement":
+    """
+    Create an element of the given type from the given arguments once and return the same instance afterwards.
+
+    The cache is typed, so arguments that compare equal but differ in type, such as 1 and True, get separate elements.
+
+    :param element_type: The element class to instantiate.
+    :param content: Hashable content for the element, e.g. a string.
+    :param kwargs: Hashable keyword arguments for the element class, in call order.
+    :return: The shared element instance, frozen so it cannot be modified.
+    """
+    element: BaseHTMLElement = element_type(content=content, **kwargs)
+    element._frozen = True
+    return element
+
+
+def _extract_attributes(kwargs: dict[str, any]) -> dict[str, any]:
+    """
+    Remove the attributes keyword argument from a tag's keyword arguments and return a copy to extend.
+
+    Tag classes add their own attributes to the returned dict, so the caller's dict is never modified.
+
+    :param kwargs: The keyword arguments passed to the tag class; the attributes entry is removed.
+    :return: A new dict with the caller's extra attributes, or an empty dict.
+    """
+    extra_attributes: dict[str, any] | None = kwargs.pop("attributes", None)
+    return dict(extra_attributes) if extra_attributes else {}
+
+
+# Renderers for the most common content types, looked up by exact type so plain text skips the isinstance check.
+# Numbers contain no HTML special characters and need no escaping.
+_TEXT_HANDLERS: dict[type, Callable[[any], str]] = {
+    str: _escape,
+    int: str,
+    float: str,
+}
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
 class SafeHTMLElement(GeneralBaseElement):
-    def __init__(self, content: str) -> None:
+    __slots__ = ("_content_str",)
+
+    def __init__(self, content: any) -> None:
         """
         Initializes a new SafeHTMLElement instance.
 
@@ -18,7 +167,16 @@ class SafeHTMLElement(GeneralBaseElement):
 
         :param content: Content to be wrapped within the tag, assumed to be safe HTML.
         """
-        self.content: str = content
+        self._content_str: str = content if type(content) is str else str(content)
+
+    @property
+    def content(self) -> str:
+        """
+        The safe HTML content, converted to a string once at construction.
+
+        :return: The safe HTML content as a string.
+        """
+        return self._content_str
 
     def to_string(self) -> str:
         """
@@ -35,10 +193,31 @@ class SafeHTMLElement(GeneralBaseElement):
 
         :return: The safe HTML content as a string.
         """
-        return str(self.content)
+        return self._content_str
 
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class BaseHTMLElement(GeneralBaseElement):
+    __slots__ = (
+        "tag_name",
+        "attributes",
+        "content",
+        "self_closing",
+        "declaration",
+        "custom_utemplates_conversion_functions",
+        "id_attribute",
+        "class_attribute",
+        "style",
+        "title",
+        "lang",
+        "dir",
+        "tab_index",
+        "_attributes_str",
+        "_renderer",
+        "_rendered",
+        "_frozen",
+    )
+
     def __init__(
             self,
             tag_name: str,
@@ -48,12 +227,12 @@ class BaseHTMLElement(GeneralBaseElement):
             declaration: bool = False,
             custom_utemplates_conversion_functions: list = None,
             id_attribute: str = None,
-            class_attribute: str | list[str] = None,
+            class_attribute: str | list[str] | None = None,
             style: str = None,
             title: str = None,
             lang: str = None,
             dir: str = None,
-            tab_index: str | int = None,
+            tab_index: str | int | None = None,
             **kwargs
     ) -> None:
         """
@@ -82,45 +261,97 @@ class BaseHTMLElement(GeneralBaseElement):
         :param tab_index: Tab index attribute for the HTML element; can be an integer or a string representation of an integer.
         :param kwargs: Additional attributes not explicitly listed. Attribute names with underscores will be replaced by hyphens.
         """
-        self.tag_name: str = tag_name
-        self.attributes: dict[str, any] = attributes if attributes is not None else {}
+        self.tag_name: str = _TAG_NAMES.get(tag_name) or _tag_name(tag_name)
+        attrs: dict[str, any] = attributes if attributes is not None else {}
+        self.attributes: dict[str, any] = attrs
+        items: list[any]
         if content is None:
-            self.content: list[any] = []
+            items = []
+        elif isinstance(content, list):
+            items = content
         elif not isinstance(content, (str, bytes)) and hasattr(content, "__iter__"):
-            # noinspection PyTypeChecker
-            self.content: list[any] = content
+            # Other iterables are copied into a list, so add_child works and a generator renders every time.
+            items = list(content)
         else:
-            self.content: list[any] = [content]
-        self.self_closing: bool = self_closing
-        if self.self_closing:
-            self.attributes["content"] = "".join(str(content_item) for content_item in self.content)
+            items = [content]
+        self.content: list[any] = items
+        # Self-closing tags carry their content as a content attribute, e.g. <meta>; without content there is none.
+        if self_closing and items:
+            attrs[_CONTENT] = "".join([str(content_item) for content_item in items])
         self.declaration: bool = declaration
-        if self.declaration:
-            self.self_closing: bool = True
-        self.custom_utemplates_conversion_functions: list = custom_utemplates_conversion_functions
-
-        self.id_attribute: str | None = id_attribute if id_attribute is not None else self.attributes.get("id")
-        self.attributes["id"] = self.id_attribute
-        self.class_attribute: str | list[str] | None = class_attribute if class_attribute is not None \
-            else self.attributes.get("class")
-        if isinstance(self.class_attribute, list):
-            self.class_attribute: str = " ".join(self.class_attribute)
-        self.attributes["class"] = self.class_attribute
-        self.style: str | None = style if style is not None else self.attributes.get("style")
-        self.attributes["style"] = self.style
-        self.title: str | None = title if title is not None else self.attributes.get("title")
-        self.attributes["title"] = self.title
-        self.lang: str | None = lang if lang is not None else self.attributes.get("lang")
-        self.attributes["lang"] = self.lang
-        self.dir: str | None = dir if dir is not None else self.attributes.get("dir")
-        self.attributes["dir"] = self.dir
-        self.tab_index: str | int | None = tab_index if tab_index is not None else self.attributes.get("tabindex")
-        if isinstance(self.tab_index, int):
-            self.tab_index: str = str(self.tab_index)
-        self.attributes["tabindex"] = self.tab_index
-
-        for key, value in kwargs.items():
-            self.attributes[key.replace("_", "-")] = value
+        self.self_closing: bool = self_closing or declaration
+        self.custom_utemplates_conversion_functions: list | None = custom_utemplates_conversion_functions
+
+        # Standard attributes that were not given are left out of the dict rather than stored as None.
+        if id_attribute is None:
+            id_attribute = attrs.get(_ID)
+        else:
+            attrs[_ID] = id_attribute
+        self.id_attribute: str | None = id_attribute
+        if class_attribute is None:
+            class_attribute = attrs.get(_CLASS)
+        if class_attribute is not None:
+            # The exact type check is the fast path; str subclasses are still used as a single class string.
+            if type(class_attribute) is not str and not isinstance(class_attribute, str):
+                class_attribute = " ".join(class_attribute)
+            attrs[_CLASS] = class_attribute
+        self.class_attribute: str | None = class_attribute
+        if style is None:
+            style = attrs.get(_STYLE)
+        else:
+            attrs[_STYLE] = style
+        self.style: str | None = style
+        if title is None:
+            title = attrs.get(_TITLE)
+        else:
+            attrs[_TITLE] = title
+        self.title: str | None = title
+        if lang is None:
+            lang = attrs.get(_LANG)
+        else:
+            attrs[_LANG] = lang
+        self.lang: str | None = lang
+        if dir is None:
+            dir = attrs.get(_DIR)
+        else:
+            attrs[_DIR] = dir
+        self.dir: str | None = dir
+        if tab_index is None:
+            tab_index = attrs.get(_TABINDEX)
+        if tab_index is not None:
+            if type(tab_index) is not str:
+                tab_index = str(tab_index)
+            attrs[_TABINDEX] = tab_index
+        self.tab_index: str | None = tab_index
+
+        if kwargs:
+            names: dict[str, str] = _ATTRIBUTE_NAMES
+            attrs.update({names.get(key) or _attribute_name(key): value for key, value in kwargs.items()})
+
+        self._frozen: bool = False
+        self._build_attributes()
+        self._select_renderer()
+
+    @classmethod
+    def interned(cls, content: any = None, **kwargs) -> "BaseHTMLElement":
+        """
+        Return a shared instance of the class for the given content and keyword arguments.
+
+        HTML Use Case:
+            Repeated calls with the same arguments return the same object, so markup that pages
+            emit many times, such as a `<meta charset>` or a repeated caption, is built only once.
+            All arguments must be hashable. The returned element is shared, so it is frozen:
+            add_child and invalidate_cache raise TypeError on it.
+
+        Example:
+            CaptionElement.interned("Table Title")
+            MetaElement.interned(charset="UTF-8")
+
+        :param content: Hashable content for the element, e.g. a string.
+        :param kwargs: Hashable keyword arguments accepted by the class's constructor.
+        :return: The shared element instance.
+        """
+        return _shared_element(cls, content, **kwargs)
 
     def add_child(self, child: GeneralBaseElement) -> None:
         """
@@ -135,103 +366,172 @@ class BaseHTMLElement(GeneralBaseElement):
             div_element.add_child(span_element)
 
         :param child: The BaseHTMLElement instance to add as a child.
+        :raises TypeError: If the element is a frozen shared instance, e.g. one returned by interned().
         """
+        if self._frozen:
+            raise TypeError(f"{type(self).__name__} instance is shared and cannot be modified")
         self.content.append(child)
 
-    @property
-    def _attributes(self) -> str:
+    def invalidate_cache(self) -> None:
         """
-        Generate a string that represents all the HTML attributes.
+        Rebuild the cached rendering state after the element has been changed.
+
+        HTML Use Case:
+            The attributes string and the render path are chosen once when the element is
+            created. Call this method after mutating the element's attributes or its
+            self_closing/declaration flags so the change is rendered.
+
+        Example:
+            div_element = BaseHTMLElement("div")
+            div_element.attributes["class"] = "container"
+            div_element.invalidate_cache()
+
+        :raises TypeError: If the element is a frozen shared instance, e.g. one returned by interned().
+        """
+        if self._frozen:
+            raise TypeError(f"{type(self).__name__} instance is shared and cannot be modified")
+        self._build_attributes()
+        self._select_renderer()
+
+    def _build_attributes(self) -> None:
+        """
+        Build and cache a string that represents all the HTML attributes.
 
         HTML Use Case:
             This is used internally to generate the string that will
             be inserted into the opening tag for the HTML element.
 
+            The string is interned, so elements with the same attributes, such as
+            uniformly styled links, share one string object.
+
         Example:
-            Given {"class": "test", "id": "elem1"}, returns ' class="test" id="elem1"'
-
-        :return: String representing the attributes.
-        """
-        attributes_str: str = ""
-        for key, value in self.attributes.items():
-            if value is not None:
-                if isinstance(value, bool):
-                    if value:
-                        attributes_str += f" {key}"
-                else:
-                    if '"' in value:
-                        attributes_str += f" {key}='{value}'"
-                    else:
-                        attributes_str += f' {key}="{value}"'
-        return attributes_str
+            Given {"class": "test", "id": "elem1"}, caches ' class="test" id="elem1"'
+        """
+        self._attributes_str: str = intern("".join([
+            (f" {key}" if value else "") if isinstance(value, bool)
+            else (f" {key}='{value}'" if '"' in value else f' {key}="{value}"')
+            for key, value in self.attributes.items() if value is not None
+        ]))
 
-    @property
-    def _opening_tag(self) -> str:
+    def _select_renderer(self) -> None:
         """
-        Generate the opening tag string.
+        Pick the render function matching the element's shape.
 
         HTML Use Case:
-            Used to create the opening tag for the HTML element.
-            Adds attributes if present.
+            Declaration, self-closing and regular tags are rendered differently. The
+            choice is fixed when the element is created, so it is made once here
+            instead of being branched on every render.
 
-        Example:
-            For a div element with class "test", returns '<div class="test">'
+            Declaration and self-closing tags have no rendered content, so their output
+            only depends on state that invalidate_cache rebuilds. They are rendered once
+            here and to_string returns the stored string.
 
-        :return: Opening tag as a string.
+        Example:
+            For a declaration element, to_string will return the result of _render_declaration.
         """
-        if self.self_closing and not self.declaration:
-            return f"<{self.tag_name}{self._attributes}/>"
+        if self.declaration:
+            self._rendered = self._render_declaration()
+            self._renderer = type(self)._render_stored
+        elif self.self_closing:
+            self._rendered = self._render_self_closing()
+            self._renderer = type(self)._render_stored
         else:
-            return f"<{self.tag_name}{self._attributes}>"
+            self._rendered = ""
+            self._renderer = type(self)._render_normal
 
-    @property
-    def _content(self) -> str:
+    def _content_parts(
+            self,
+            _isinstance=isinstance,
+            _str=str,
+            _element_type: type = GeneralBaseElement,
+            _handlers: dict[type, Callable[[any], str]] = _TEXT_HANDLERS
+    ) -> list[str | GeneralBaseElement]:
         """
-        Generate the content string, ensuring it is converted and escaped.
+        Generate the content parts, ensuring text is converted and escaped.
 
         HTML Use Case:
             Used internally to insert the content between the opening
-            and closing tags of the HTML element.
+            and closing tags of the HTML element. Text items are returned
+            as escaped strings and nested elements are returned as is,
+            so the serializer can render them without recursing.
 
         Example:
-            For a div element with content "Hello", returns 'Hello'
+            For a div element with content ["a<b", span_element], returns ['a&lt;b', span_element]
 
-        :return: Content as a string.
+        :return: List of escaped strings and nested elements, in content order.
         """
-        def ensure_content_is_converted_and_escaped(content: any) -> str:
-            if not isinstance(content, GeneralBaseElement):
-                content: any = convert_value(
-                    content, conversion_functions_list=self.custom_utemplates_conversion_functions
-                )
-            if isinstance(content, GeneralBaseElement):
-                escaped_content: str = str(content)
+        conversion_functions: list | None = self.custom_utemplates_conversion_functions
+        if conversion_functions is None:
+            conversion_functions = ConfigurationManager.get_conversion_functions()
+        items: Iterable[any] = self.content
+        if conversion_functions:
+            items = [
+                item if _isinstance(item, _element_type)
+                else convert_value(item, conversion_functions_list=conversion_functions)
+                for item in items
+            ]
+        get_handler = _handlers.get
+        parts: list[str | GeneralBaseElement] = []
+        append = parts.append
+        for item in items:
+            handler: Callable[[any], str] | None = get_handler(type(item))
+            if handler is not None:
+                append(handler(item))
+            elif _isinstance(item, _element_type):
+                append(item)
             else:
-                escaped_content: str = html.escape(str(content))
-            return escaped_content
-        if self.self_closing:
-            return ""
-        content_strs: list[str] = []
-        for item in self.content:
-            content_strs.append(ensure_content_is_converted_and_escaped(item))
-        return "".join(content_strs)
+                append(_escape(_str(item)))
+        return parts
 
-    @property
-    def _closing_tag(self) -> str:
+    def _render_declaration(self) -> str:
         """
-        Generate the closing tag string.
+        Generate a declaration tag, which has neither content nor a closing tag.
 
-        HTML Use Case:
-            Used to create the closing tag for the HTML element.
+        Example:
+            For a doctype element, returns '<!DOCTYPE html>'
+
+        :return: Declaration tag as a string.
+        """
+        return f"<{self.tag_name}{self._attributes_str}>"
+
+    def _render_self_closing(self) -> str:
+        """
+        Generate a self-closing tag.
 
         Example:
-            For a div element, returns '</div>'
+            For a br element, returns '<br/>'
 
-        :return: Closing tag as a string.
+        :return: Self-closing tag as a string.
         """
-        if self.self_closing:
-            return ""
-        else:
-            return f"</{self.tag_name}>"
+        return f"<{self.tag_name}{self._attributes_str}/>"
+
+    def _render_stored(self) -> str:
+        """
+        Return the tag rendered by _select_renderer.
+
+        :return: The stored declaration or self-closing tag.
+        """
+        return self._rendered
+
+    def _render_normal(self) -> str:
+        """
+        Generate a tag with its content and closing tag.
+
+        Leaf elements, whose content is empty or a single piece of text, are built with a
+        single f-string; elements with nested content are serialized by _write_tree.
+
+        Example:
+            For a div element with content "Hello", returns '<div>Hello</div>'
+
+        :return: Full HTML tag as a string.
+        """
+        parts: list[str | GeneralBaseElement] = self._content_parts()
+        if not parts or (len(parts) == 1 and type(parts[0]) is str):
+            tag_name: str = self.tag_name
+            return f"<{tag_name}{self._attributes_str}>{parts[0] if parts else ''}</{tag_name}>"
+        out: list[str] = []
+        _write_tree(self, out.append, parts)
+        return "".join(out)
 
     def to_string(self) -> str:
         """
@@ -247,4 +547,77 @@ class BaseHTMLElement(GeneralBaseElement):
 
         :return: Full HTML tag as a string.
         """
-        return f"{self._opening_tag}{self._content}{self._closing_tag}"
+        return self._renderer(self)
+
+    def render_to(self, write: Callable[[str], any]) -> None:
+        """
+        Render the full HTML element into a sink callable.
+
+        HTML Use Case:
+            Streams the element and all of its nested elements directly into a
+            response or buffer, without building a string for every subtree or for
+            the document as a whole.
+
+        Example:
+            div_element.render_to(response.write)
+
+        :param write: Callable receiving each rendered piece, e.g. a file's or response's write method.
+        """
+        if self._renderer is BaseHTMLElement._render_normal and type(self).to_string is BaseHTMLElement.to_string:
+            _write_tree(self, write)
+        else:
+            write(self.to_string())
+
+
+def _write_tree(
+        root: BaseHTMLElement,
+        write: Callable[[str], any],
+        parts: list[str | GeneralBaseElement] | None = None,
+        _str=str,
+        _isinstance=isinstance,
+        _element_type: type = BaseHTMLElement
+) -> None:
+    """
+    Write an element and all of its nested elements to a sink without recursion.
+
+    Nested BaseHTMLElement instances that use the default rendering are expanded in place
+    with an explicit stack, so the whole tree is emitted as a flat sequence of string
+    tokens. Other elements are written through their own to_string method.
+
+    :param root: The element to render.
+    :param write: Callable receiving each rendered token, e.g. list.append or a file's write.
+    :param parts: The root's content parts, if the caller has already computed them.
+    """
+    safe_type: type = SafeHTMLElement
+    base_to_string = BaseHTMLElement.to_string
+    render_normal = BaseHTMLElement._render_normal
+    open_tags: dict[str, str] = _OPEN_TAGS
+    close_tags: dict[str, str] = _CLOSE_TAGS
+    tag_name: str = root.tag_name
+    attributes_str: str = root._attributes_str
+    write(f"<{tag_name}{attributes_str}>" if attributes_str else open_tags.get(tag_name) or f"<{tag_name}>")
+    stack: list[str | GeneralBaseElement] = root._content_parts() if parts is None else parts
+    stack.reverse()
+    stack.insert(0, close_tags.get(tag_name) or f"</{tag_name}>")
+    pop = stack.pop
+    push = stack.append
+    extend = stack.extend
+    while stack:
+        # Typed loosely: the checks below dispatch on the exact type, which the annotations cannot express.
+        node: Any = pop()
+        node_type: Any = type(node)
+        if node_type is _str:
+            write(node)
+        elif node_type is safe_type:
+            write(node._content_str)
+        elif _isinstance(node, _element_type) and node._renderer is render_normal \
+                and node_type.to_string is base_to_string:
+            tag_name = node.tag_name
+            attributes_str = node._attributes_str
+            write(f"<{tag_name}{attributes_str}>" if attributes_str else open_tags.get(tag_name) or f"<{tag_name}>")
+            push(close_tags.get(tag_name) or f"</{tag_name}>")
+            node_parts: list[str | GeneralBaseElement] = node._content_parts()
+            node_parts.reverse()
+            extend(node_parts)
+        else:
+            write(node.to_string())
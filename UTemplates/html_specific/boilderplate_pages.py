@@ -1,9 +1,12 @@
-from .base import BaseHTMLElement
+from typing import (Callable, Iterable)
+from .base import (BaseHTMLElement, SafeHTMLElement, _escape)
 from .declarations import HTML5Declaration
-from .tags import (TitleElement, HeadElement, BodyElement, HTMLElement, DoctypeElement)
-from ..general_base import GeneralBaseElement
+from .tags import (TitleElement, BodyElement, DoctypeElement)
+from ..configuration import ConfigurationManager
+from ..general_base import (GeneralBaseElement, mypyc_attr)
 
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class HTMLPage(GeneralBaseElement):
     """
     Represents an HTML web page.
@@ -24,62 +27,143 @@ class HTMLPage(GeneralBaseElement):
             p_element = PElement(content="Hello, world!")
             my_page.add_to_body(p_element)
 
+           Several elements can be added in one call with extend_body, or passed as initial_body
+           when the page is created.
+
         4. Rendering the page:
             rendered = my_page.to_string()
 
+        5. Streaming a large page to a file without building it as one string:
+            with open("page.html", "w", encoding="utf-8") as f:
+                my_page.write(f)
+
+        6. Streaming the page into a response:
+            my_page.render_to(response.write)
+
+    Every render walks the whole page, so changes to elements that were already added are always
+    picked up. A page that is finished can be frozen with freeze(); its rendering is then cached
+    until an element is added through add_to_head or add_to_body. Call invalidate_cache after
+    mutating elements of a frozen page that were already added.
+
+    Elements added with static=True are rendered immediately, and consecutive static elements
+    are merged into a single chunk of markup, so they cost one string at render time.
+
     Attributes:
         title (str): The title of the web page. Defaults to "Untitled".
     """
-
-    def __init__(self, title: str = "Untitled", declaration_element: DoctypeElement = HTML5Declaration()) -> None:
+    __slots__ = (
+        "declaration_element",
+        "_title_str",
+        "_head_children",
+        "_body_element",
+        "_static_head",
+        "_static_body",
+        "_frozen",
+        "_dirty",
+        "_cached_str",
+    )
+
+    def __init__(
+            self,
+            title: str = "Untitled",
+            declaration_element: DoctypeElement = HTML5Declaration(),
+            initial_body: Iterable[BaseHTMLElement] | None = None
+    ) -> None:
         """
         Initializes the HTMLPage instance.
 
         Args:
             title (str, optional): The title of the web page. Defaults to "Untitled".
             declaration_element (DoctypeElement, optional): The type of HTML document declaration. Defaults to HTML5Declaration.
+            initial_body (Iterable[BaseHTMLElement], optional): Elements the body starts with. Defaults to None.
         """
         self.declaration_element: DoctypeElement = declaration_element
-        self._head_element: HeadElement = HeadElement(content=TitleElement(content=title))
-        self._body_element: BodyElement = BodyElement()
-
-    def add_to_head(self, element: BaseHTMLElement) -> None:
+        # The title cannot change after construction, so it is escaped once here instead of on every render.
+        self._title_str: str
+        if type(title) is str and not ConfigurationManager.get_conversion_functions():
+            self._title_str = f"<title>{_escape(title)}</title>"
+        else:
+            self._title_str = TitleElement(content=title).to_string()
+        self._head_children: list[GeneralBaseElement] = []
+        self._body_element: BodyElement = BodyElement(content=list(initial_body) if initial_body is not None else None)
+        self._static_head: list[str] = []
+        self._static_body: list[str] = []
+        self._frozen: bool = False
+        self._dirty: bool = True
+        self._cached_str: str | None = None
+
+    def add_to_head(self, element: BaseHTMLElement, static: bool = False) -> None:
         """
         Appends an element to the head section of the HTML page.
 
         Args:
             element (BaseHTMLElement): Element to add to the head section.
+            static (bool, optional): If True, the element is rendered now and later changes to it are ignored.
+                Defaults to False.
         """
-        self._head_element.add_child(element)
-
-    def add_to_body(self, element: BaseHTMLElement) -> None:
+        if static:
+            self._static_head.append(element.to_string())
+        else:
+            self._fold_static(self._head_children, self._static_head)
+            self._head_children.append(element)
+        self._dirty = True
+
+    def add_to_body(self, element: BaseHTMLElement, static: bool = False) -> None:
         """
         Appends an element to the body section of the HTML page.
 
         Args:
             element (BaseHTMLElement): Element to add to the body section.
+            static (bool, optional): If True, the element is rendered now and later changes to it are ignored.
+                Defaults to False.
+        """
+        if static:
+            self._static_body.append(element.to_string())
+        else:
+            self._fold_static(self._body_element.content, self._static_body)
+            self._body_element.add_child(element)
+        self._dirty = True
+
+    def extend_body(self, elements: Iterable[BaseHTMLElement]) -> None:
         """
-        self._body_element.add_child(element)
+        Appends several elements to the body section of the HTML page at once.
 
-    @property
-    def _html_level_elements(self) -> list[BaseHTMLElement]:
+        Args:
+            elements (Iterable[BaseHTMLElement]): Elements to add to the body section, in order.
         """
-        Combines head and body elements for rendering in the HTML document.
+        self._fold_static(self._body_element.content, self._static_body)
+        self._body_element.content.extend(elements)
+        self._dirty = True
 
-        Returns:
-            list[BaseHTMLElement]: A list containing the head and body elements.
+    @staticmethod
+    def _fold_static(children: list[GeneralBaseElement], pending: list[str]) -> None:
         """
-        return [self._head_element, self._body_element]
+        Moves a run of pre-rendered static elements into a section as one safe chunk.
 
-    @property
-    def _page_level_elements(self) -> list[BaseHTMLElement]:
+        Args:
+            children (list[GeneralBaseElement]): The head or body children receiving the chunk.
+            pending (list[str]): Rendered static elements waiting to be added; emptied by this call.
         """
-        Wraps the entire content within the HTML declaration and HTML tags.
+        if pending:
+            children.append(SafeHTMLElement("".join(pending)))
+            pending.clear()
 
-        Returns:
-            list[BaseHTMLElement]: A list containing the HTML declaration and tags enclosing the content.
+    def freeze(self) -> None:
+        """
+        Marks the page as finished, so its rendering is cached and reused by later renders.
+
+        The cache is discarded when an element is added through add_to_head, add_to_body or
+        extend_body, or when invalidate_cache is called.
+        """
+        self._frozen = True
+        self._dirty = True
+
+    def invalidate_cache(self) -> None:
+        """
+        Discards the cached rendering of a frozen page so the next render reflects changes
+        made to elements that were already added.
         """
-        return [self.declaration_element, HTMLElement(content=self._html_level_elements)]
+        self._dirty = True
 
     def to_string(self) -> str:
         """
@@ -88,12 +172,46 @@ class HTMLPage(GeneralBaseElement):
         Returns:
             str: The HTML page in string format.
         """
-        page_str: str = ""
-        for element in self._page_level_elements:
-            page_str += str(element)
+        if self._frozen and not self._dirty and self._cached_str is not None:
+            return self._cached_str
+        self._fold_static(self._head_children, self._static_head)
+        self._fold_static(self._body_element.content, self._static_body)
+        head_str: str = "".join([child.to_string() for child in self._head_children])
+        page_str: str = (
+            f"{self.declaration_element.to_string()}<html><head>{self._title_str}{head_str}</head>"
+            f"{self._body_element.to_string()}</html>"
+        )
+        if self._frozen:
+            self._cached_str = page_str
+            self._dirty = False
         return page_str
 
+    def render_to(self, write: Callable[[str], any]) -> None:
+        """
+        Renders the entire HTML page into a sink callable.
+
+        The head and body are streamed element by element, so a large page is never held in
+        memory as a single string. A frozen page that is already cached is written in one call.
 
+        Args:
+            write (Callable[[str], any]): Callable receiving each rendered piece, e.g. a response's write method.
+        """
+        if self._frozen and not self._dirty and self._cached_str is not None:
+            write(self._cached_str)
+            return
+        self._fold_static(self._head_children, self._static_head)
+        self._fold_static(self._body_element.content, self._static_body)
+        write(self.declaration_element.to_string())
+        write("<html><head>")
+        write(self._title_str)
+        for child in self._head_children:
+            child.render_to(write)
+        write("</head>")
+        self._body_element.render_to(write)
+        write("</html>")
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
 class HTML5Page(HTMLPage):
     """
     Represents an HTML5 web page, a subclass of HTMLPage.
@@ -105,6 +223,8 @@ class HTML5Page(HTMLPage):
             my_page = HTML5Page(title="My Page")
 
     """
+    __slots__ = ()
+
     def __init__(self, **kwargs) -> None:
         """
         Initializes the HTML5Page instance, setting the HTML5 declaration as default.
@@ -112,4 +232,5 @@ class HTML5Page(HTMLPage):
         Args:
             **kwargs: Arguments to be passed to the base HTMLPage class.
         """
-        super().__init__(declaration_element=HTML5Declaration(), **kwargs)
+        # Called directly rather than through super(): compiled (mypyc) builds mis-bind **kwargs on super() calls.
+        HTMLPage.__init__(self, declaration_element=HTML5Declaration(), **kwargs)
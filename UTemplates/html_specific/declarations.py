@@ -1,7 +1,50 @@
+from sys import intern
+from .base import (_shared_instance, _is_shared_instance, _register_shared_instance)
 from .tags import DoctypeElement
 
 
-class HTML5Declaration(DoctypeElement):
+class _PredefinedDeclaration(DoctypeElement):
+    """
+    Base class for the predefined doctype declarations below.
+
+    A predefined declaration created without extra keyword arguments is stateless and always
+    renders the same string. Such declarations are shared: each class creates a single instance
+    and renders it once. The shared instance is frozen, so add_child and invalidate_cache raise
+    TypeError on it; pass keyword arguments to get a separate instance that can be modified.
+
+    :param declaration: The doctype declaration text.
+    :param kwargs: Any additional keyword arguments to pass to the parent DoctypeElement class.
+    """
+
+    def __new__(cls, *args, **kwargs) -> "_PredefinedDeclaration":
+        """
+        Returns the shared instance of the class when no keyword arguments are given.
+
+        :param kwargs: Any additional keyword arguments; if given, a new instance is created.
+        """
+        if not kwargs:
+            instance: _PredefinedDeclaration | None = _shared_instance(cls)
+            if instance is not None:
+                return instance
+        return super().__new__(cls)
+
+    def __init__(self, declaration: str, **kwargs) -> None:
+        """
+        Initializes the predefined declaration instance.
+        The shared instance is only initialized the first time it is created.
+
+        :param declaration: The doctype declaration text.
+        :param kwargs: Any additional keyword arguments to pass to the parent DoctypeElement class.
+        """
+        shared: bool = not kwargs
+        if shared and _is_shared_instance(self):
+            return
+        super().__init__(declaration, **kwargs)
+        if shared:
+            _register_shared_instance(self)
+
+
+class HTML5Declaration(_PredefinedDeclaration):
     """
     Represents an HTML5 declaration.
 
@@ -16,16 +59,18 @@ class HTML5Declaration(DoctypeElement):
 
     :param kwargs: Any additional keyword arguments to pass to the parent DoctypeElement class.
     """
+    _DTD: str = intern("html")
+
     def __init__(self, **kwargs) -> None:
         """
         Initializes the HTML5Declaration instance.
 
         :param kwargs: Any additional keyword arguments to pass to the parent DoctypeElement class.
         """
-        super().__init__("html", **kwargs)
+        super().__init__(self._DTD, **kwargs)
 
 
-class HTML4_01StrictDeclaration(DoctypeElement):
+class HTML4_01StrictDeclaration(_PredefinedDeclaration):
     """
     Represents an HTML 4.01 Strict doctype declaration.
 
@@ -40,6 +85,7 @@ class HTML4_01StrictDeclaration(DoctypeElement):
 
     :param kwargs: Any additional keyword arguments to pass to the parent DoctypeElement class.
     """
+    _DTD: str = intern('HTML PUBLIC "-//W3C//DTD HTML 4.01//EN" "http://www.w3.org/TR/html4/strict.dtd"')
 
     def __init__(self, **kwargs) -> None:
         """
@@ -47,12 +93,10 @@ class HTML4_01StrictDeclaration(DoctypeElement):
 
         :param kwargs: Any additional keyword arguments to pass to the parent DoctypeElement class.
         """
-        super().__init__(
-            'HTML PUBLIC "-//W3C//DTD HTML 4.01//EN" "http://www.w3.org/TR/html4/strict.dtd"', **kwargs
-        )
+        super().__init__(self._DTD, **kwargs)
 
 
-class HTML4_01TransitionalDeclaration(DoctypeElement):
+class HTML4_01TransitionalDeclaration(_PredefinedDeclaration):
     """
     Represents an HTML 4.01 Transitional doctype declaration.
 
@@ -67,6 +111,7 @@ class HTML4_01TransitionalDeclaration(DoctypeElement):
 
     :param kwargs: Any additional keyword arguments to pass to the parent DoctypeElement class.
     """
+    _DTD: str = intern('HTML PUBLIC "-//W3C//DTD HTML 4.01 Transitional//EN" "http://www.w3.org/TR/html4/loose.dtd"')
 
     def __init__(self, **kwargs) -> None:
         """
@@ -74,13 +119,10 @@ class HTML4_01TransitionalDeclaration(DoctypeElement):
 
         :param kwargs: Any additional keyword arguments to pass to the parent DoctypeElement class.
         """
-        super().__init__(
-            'HTML PUBLIC "-//W3C//DTD HTML 4.01 Transitional//EN" "http://www.w3.org/TR/html4/loose.dtd"',
-            **kwargs
-        )
+        super().__init__(self._DTD, **kwargs)
 
 
-class XHTML1_0StrictDeclaration(DoctypeElement):
+class XHTML1_0StrictDeclaration(_PredefinedDeclaration):
     """
     Represents an XHTML 1.0 Strict doctype declaration.
 
@@ -95,6 +137,10 @@ class XHTML1_0StrictDeclaration(DoctypeElement):
 
     :param kwargs: Any additional keyword arguments to pass to the parent DoctypeElement class.
     """
+    _DTD: str = intern(
+        'html PUBLIC "-//W3C//DTD XHTML 1.0 Strict//EN" '
+        '"http://www.w3.org/TR/xhtml1/DTD/xhtml1-strict.dtd"'
+    )
 
     def __init__(self, **kwargs) -> None:
         """
@@ -102,14 +148,10 @@ class XHTML1_0StrictDeclaration(DoctypeElement):
 
         :param kwargs: Any additional keyword arguments to pass to the parent DoctypeElement class.
         """
-        super().__init__(
-            'html PUBLIC "-//W3C//DTD XHTML 1.0 Strict//EN" '
-            '"http://www.w3.org/TR/xhtml1/DTD/xhtml1-strict.dtd"',
-            **kwargs
-        )
+        super().__init__(self._DTD, **kwargs)
 
 
-class XHTML1_0TransitionalDeclaration(DoctypeElement):
+class XHTML1_0TransitionalDeclaration(_PredefinedDeclaration):
     """
     Represents an XHTML 1.0 Transitional doctype declaration.
 
@@ -124,6 +166,10 @@ class XHTML1_0TransitionalDeclaration(DoctypeElement):
 
     :param kwargs: Any additional keyword arguments to pass to the parent DoctypeElement class.
     """
+    _DTD: str = intern(
+        'html PUBLIC "-//W3C//DTD XHTML 1.0 Transitional//EN" '
+        '"http://www.w3.org/TR/xhtml1/DTD/xhtml1-transitional.dtd"'
+    )
 
     def __init__(self, **kwargs) -> None:
         """
@@ -131,14 +177,10 @@ class XHTML1_0TransitionalDeclaration(DoctypeElement):
 
         :param kwargs: Any additional keyword arguments to pass to the parent DoctypeElement class.
         """
-        super().__init__(
-            'html PUBLIC "-//W3C//DTD XHTML 1.0 Transitional//EN" '
-            '"http://www.w3.org/TR/xhtml1/DTD/xhtml1-transitional.dtd"',
-            **kwargs
-        )
+        super().__init__(self._DTD, **kwargs)
 
 
-class XHTML1_1Declaration(DoctypeElement):
+class XHTML1_1Declaration(_PredefinedDeclaration):
     """
     Represents an XHTML 1.1 doctype declaration.
 
@@ -153,6 +195,7 @@ class XHTML1_1Declaration(DoctypeElement):
 
     :param kwargs: Any additional keyword arguments to pass to the parent DoctypeElement class.
     """
+    _DTD: str = intern('html PUBLIC "-//W3C//DTD XHTML 1.1//EN" "http://www.w3.org/TR/xhtml11/DTD/xhtml11.dtd"')
 
     def __init__(self, **kwargs) -> None:
         """
@@ -160,13 +203,10 @@ class XHTML1_1Declaration(DoctypeElement):
 
         :param kwargs: Any additional keyword arguments to pass to the parent DoctypeElement class.
         """
-        super().__init__(
-            'html PUBLIC "-//W3C//DTD XHTML 1.1//EN" "http://www.w3.org/TR/xhtml11/DTD/xhtml11.dtd"',
-            **kwargs
-        )
+        super().__init__(self._DTD, **kwargs)
 
 
-class HTML3_2Declaration(DoctypeElement):
+class HTML3_2Declaration(_PredefinedDeclaration):
     """
     Represents an HTML 3.2 doctype declaration.
 
@@ -181,6 +221,7 @@ class HTML3_2Declaration(DoctypeElement):
 
     :param kwargs: Any additional keyword arguments to pass to the parent DoctypeElement class.
     """
+    _DTD: str = intern('HTML PUBLIC "-//W3C//DTD HTML 3.2 Final//EN"')
 
     def __init__(self, **kwargs) -> None:
         """
@@ -188,7 +229,4 @@ class HTML3_2Declaration(DoctypeElement):
 
         :param kwargs: Any additional keyword arguments to pass to the parent DoctypeElement class.
         """
-        super().__init__(
-            'HTML PUBLIC "-//W3C//DTD HTML 3.2 Final//EN"',
-            **kwargs
-        )
+        super().__init__(self._DTD, **kwargs)
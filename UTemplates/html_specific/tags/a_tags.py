@@ -1,6 +1,56 @@
-from ..base import BaseHTMLElement
+from functools import lru_cache
+from typing import Iterable
+from ..base import (BaseHTMLElement, _extract_attributes)
+from ...general_base import mypyc_attr
 
 
+# The tag classes call the base initialiser directly; their only base is BaseHTMLElement.
+_base_init = BaseHTMLElement.__init__
+
+
+# Longer ping lists are joined directly so the cache only holds small, frequently repeated lists.
+_PING_CACHE_MAX_URLS: int = 32
+
+
+def _join_urls(urls: Iterable[str]) -> str:
+    """
+    Join ping URLs into a space-separated attribute value, converting non-string URL objects with str.
+    """
+    return " ".join([url if type(url) is str else str(url) for url in urls])
+
+
+@lru_cache(maxsize=1024)
+def _join_ping(urls: tuple[str, ...]) -> str:
+    """
+    Join a tuple of ping URLs into a space-separated attribute value, caching the result.
+    """
+    return _join_urls(urls)
+
+
+def _ping_attribute(ping: list[str] | str) -> str:
+    """
+    Build the value of the ping attribute from a non-empty list of URLs.
+
+    Identical ping lists are common across the links of a page, so small lists are joined through a cache.
+    """
+    if type(ping) is str:
+        return ping
+    if len(ping) > _PING_CACHE_MAX_URLS:
+        return _join_urls(ping)
+    return _join_ping(tuple(ping))
+
+
+_AUDIO_FLAG_NAMES: tuple[str, ...] = ("autoplay", "controls", "loop", "muted")
+
+# The boolean attributes of an audio element, indexed by their flags packed into an int (bit i is
+# _AUDIO_FLAG_NAMES[i]). Only the attributes that are set appear, since false boolean attributes are not rendered.
+_AUDIO_FLAG_ATTRIBUTES: tuple[dict[str, bool], ...] = tuple(
+    {name: True for bit, name in enumerate(_AUDIO_FLAG_NAMES) if flags >> bit & 1}
+    for flags in range(1 << len(_AUDIO_FLAG_NAMES))
+)
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
 class AnchorElement(BaseHTMLElement):
     """
     AnchorElement Class extends BaseHTMLElement to represent HTML anchor elements (`<a>`).
@@ -36,6 +86,8 @@ class AnchorElement(BaseHTMLElement):
     --------
     to_string():
         Converts the anchor element to an HTML string.
+    bulk(hrefs, **kwargs):
+        Creates one anchor element per URL, all sharing the other given arguments.
 
     Example Usage:
     --------------
@@ -48,6 +100,7 @@ class AnchorElement(BaseHTMLElement):
     <a href="https://www.example.com" target="_blank" rel="noopener"></a>
 
     """
+    __slots__ = ()
 
     def __init__(
             self,
@@ -89,21 +142,58 @@ class AnchorElement(BaseHTMLElement):
             Optional keyword arguments inherited from the BaseHTMLElement parent class.
 
         """
-        super().__init__(
-            "a",
-            href=href,
-            download=download,
-            hrelang=hreflang,
-            media=media,
-            ping=ping,
-            referrerpolicy=referrerpolicy,
-            rel=rel,
-            target=target,
-            type=type,
-            **kwargs
-        )
+        attributes: dict[str, any] = _extract_attributes(kwargs)
+        if href is not None:
+            attributes["href"] = href
+        if download:
+            attributes["download"] = download
+        if hreflang is not None:
+            attributes["hreflang"] = hreflang
+        if media is not None:
+            attributes["media"] = media
+        if ping:
+            attributes["ping"] = _ping_attribute(ping)
+        if referrerpolicy is not None:
+            attributes["referrerpolicy"] = referrerpolicy
+        if rel is not None:
+            attributes["rel"] = rel
+        if target is not None:
+            attributes["target"] = target
+        if type is not None:
+            attributes["type"] = type
+        _base_init(self, "a", attributes=attributes, **kwargs)
+
+    @classmethod
+    def bulk(cls, hrefs: Iterable[str], **kwargs) -> list["AnchorElement"]:
+        """
+        Creates one anchor element per URL, all sharing the other given arguments.
+
+        Each anchor is built through the class's constructor, so subclasses and every constructor
+        argument behave exactly as in a direct call. Each anchor gets its own content list, so
+        adding a child to one anchor does not change the others.
+
+        Parameters:
+        -----------
+        hrefs: Iterable[str]
+            The URLs of the anchors, in order.
+        **kwargs: dict
+            Any other AnchorElement argument, applied to every anchor.
+
+        Example Usage:
+        --------------
+        >>> links = AnchorElement.bulk(["/", "/about"], class_attribute="nav-link")
+        >>> print("".join(link.to_string() for link in links))
+        <a href="/" class="nav-link"></a><a href="/about" class="nav-link"></a>
+
+        """
+        content: any = kwargs.pop("content", None)
+        if content is None or isinstance(content, (str, bytes)) or not hasattr(content, "__iter__"):
+            return [cls(href=href, content=content, **kwargs) for href in hrefs]
+        items: list[any] = list(content)
+        return [cls(href=href, content=list(items), **kwargs) for href in hrefs]
 
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class AbbreviationElement(BaseHTMLElement):
     """
     AbbreviationElement Class extends BaseHTMLElement to represent HTML abbreviation elements (`<abbr>`).
@@ -133,6 +223,7 @@ class AbbreviationElement(BaseHTMLElement):
     <abbr title="HyperText Markup Language">HTML</abbr>
 
     """
+    __slots__ = ()
 
     def __init__(self, title: str, abbreviation: str, **kwargs) -> None:
         """
@@ -148,9 +239,10 @@ class AbbreviationElement(BaseHTMLElement):
             Optional keyword arguments inherited from the BaseHTMLElement parent class.
 
         """
-        super().__init__("abbr", title=title, content=abbreviation, **kwargs)
+        _base_init(self, "abbr", title=title, content=abbreviation, **kwargs)
 
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class AddressElement(BaseHTMLElement):
     """
     AddressElement Class extends BaseHTMLElement to represent HTML address elements (`<address>`).
@@ -165,6 +257,8 @@ class AddressElement(BaseHTMLElement):
     --------
     to_string():
         Converts the address element to an HTML string.
+    interned(content):
+        Returns a shared, read-only address element for frequently repeated content.
 
     Example Usage:
     --------------
@@ -177,6 +271,7 @@ class AddressElement(BaseHTMLElement):
     <address>Contact us at: <a href='mailto:webmaster@example.com'>webmaster@example.com</a></address>
 
     """
+    __slots__ = ()
 
     def __init__(self, **kwargs) -> None:
         """
@@ -186,9 +281,10 @@ class AddressElement(BaseHTMLElement):
             Optional keyword arguments inherited from the BaseHTMLElement parent class, such as 'content'.
 
         """
-        super().__init__("address", **kwargs)
+        _base_init(self, "address", **kwargs)
 
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class AreaElement(BaseHTMLElement):
     """
     AreaElement Class extends BaseHTMLElement to represent HTML area elements (`<area>`).
@@ -236,6 +332,7 @@ class AreaElement(BaseHTMLElement):
     <area href="#" shape="rect" coords="34,44,270,350" alt="Computer" />
 
     """
+    __slots__ = ()
 
     def __init__(
             self,
@@ -263,24 +360,33 @@ class AreaElement(BaseHTMLElement):
             Optional keyword arguments inherited from the BaseHTMLElement parent class.
 
         """
-        super().__init__(
-            "area",
-            alt=alt,
-            coords=coords,
-            download=download,
-            href=href,
-            hreflang=hreflang,
-            media=media,
-            referrerpolicy=referrerpolicy,
-            rel=rel,
-            shape=shape,
-            target=target,
-            type=type,
-            self_closing=True,
-            **kwargs
-        )
-
-
+        attributes: dict[str, any] = _extract_attributes(kwargs)
+        if alt is not None:
+            attributes["alt"] = alt
+        if coords is not None:
+            attributes["coords"] = coords
+        if download is not None:
+            attributes["download"] = download
+        if href is not None:
+            attributes["href"] = href
+        if hreflang is not None:
+            attributes["hreflang"] = hreflang
+        if media is not None:
+            attributes["media"] = media
+        if referrerpolicy is not None:
+            attributes["referrerpolicy"] = referrerpolicy
+        if rel is not None:
+            attributes["rel"] = rel
+        if shape is not None:
+            attributes["shape"] = shape
+        if target is not None:
+            attributes["target"] = target
+        if type is not None:
+            attributes["type"] = type
+        _base_init(self, "area", attributes=attributes, self_closing=True, **kwargs)
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
 class ArticleElement(BaseHTMLElement):
     """
     ArticleElement Class extends BaseHTMLElement to represent HTML article elements (`<article>`).
@@ -297,6 +403,8 @@ class ArticleElement(BaseHTMLElement):
     --------
     to_string():
         Converts the article element to an HTML string.
+    interned(content):
+        Returns a shared, read-only article element for frequently repeated content.
 
     Example Usage:
     --------------
@@ -305,6 +413,7 @@ class ArticleElement(BaseHTMLElement):
     <article><h1>Title</h1><p>Content of the article.</p></article>
 
     """
+    __slots__ = ()
 
     def __init__(self, **kwargs) -> None:
         """
@@ -314,9 +423,10 @@ class ArticleElement(BaseHTMLElement):
             Optional keyword arguments inherited from the BaseHTMLElement parent class, such as 'content'.
 
         """
-        super().__init__("article", **kwargs)
+        _base_init(self, "article", **kwargs)
 
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class AsideElement(BaseHTMLElement):
     """
     AsideElement Class extends BaseHTMLElement to represent HTML aside elements (`<aside>`).
@@ -333,6 +443,8 @@ class AsideElement(BaseHTMLElement):
     --------
     to_string():
         Converts the aside element to an HTML string.
+    interned(content):
+        Returns a shared, read-only aside element for frequently repeated content.
 
     Example Usage:
     --------------
@@ -341,6 +453,7 @@ class AsideElement(BaseHTMLElement):
     <aside><h4>Related Links</h4><ul><li><a href='#'>Link 1</a></li><li><a href='#'>Link 2</a></li></ul></aside>
 
     """
+    __slots__ = ()
 
     def __init__(self, **kwargs) -> None:
         """
@@ -350,9 +463,10 @@ class AsideElement(BaseHTMLElement):
             Optional keyword arguments inherited from the BaseHTMLElement parent class, such as 'content'.
 
         """
-        super().__init__("aside", **kwargs)
+        _base_init(self, "aside", **kwargs)
 
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class AudioElement(BaseHTMLElement):
     """
     AudioElement Class extends BaseHTMLElement to represent HTML audio elements (`<audio>`).
@@ -375,8 +489,8 @@ class AudioElement(BaseHTMLElement):
         Specifies that the audio will start over again every time it is finished.
     muted: bool (optional)
         Specifies that the audio output should be muted.
-    preload: bool (optional)
-        Specifies if and how the author thinks the audio should be loaded.
+    preload: str | bool (optional)
+        Specifies if and how the author thinks the audio should be loaded: "none", "metadata" or "auto".
     src: str (optional)
         Specifies the source URL of the audio file.
 
@@ -392,6 +506,7 @@ class AudioElement(BaseHTMLElement):
     <audio controls src="audio.mp3"></audio>
 
     """
+    __slots__ = ()
 
     def __init__(
             self,
@@ -399,7 +514,7 @@ class AudioElement(BaseHTMLElement):
             controls: bool = False,
             loop: bool = False,
             muted: bool = True,
-            preload: bool = True,
+            preload: str | bool = True,
             src: str = None,
             **kwargs
     ) -> None:
@@ -414,6 +529,12 @@ class AudioElement(BaseHTMLElement):
             Optional keyword arguments inherited from the BaseHTMLElement parent class.
 
         """
-        super().__init__(
-            "audio", autoplay=autoplay, controls=controls, loop=loop, muted=muted, preload=preload, src=src, **kwargs
-        )
+        flags: int = bool(autoplay) | bool(controls) << 1 | bool(loop) << 2 | bool(muted) << 3
+        attributes: dict[str, any] = _extract_attributes(kwargs)
+        attributes.update(_AUDIO_FLAG_ATTRIBUTES[flags])
+        # preload is enumerated ("none", "metadata", "auto"), so its value is kept rather than packed into the flags.
+        if preload is not None:
+            attributes["preload"] = preload
+        if src is not None:
+            attributes["src"] = src
+        _base_init(self, "audio", attributes=attributes, **kwargs)
@@ -1,6 +1,12 @@
 from ..base import BaseHTMLElement
+from ...general_base import mypyc_attr
 
 
+# The tag classes call the base initialiser directly; their only base is BaseHTMLElement.
+_base_init = BaseHTMLElement.__init__
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
 class CanvasElement(BaseHTMLElement):
     """
     CanvasElement Class extends BaseHTMLElement to represent HTML canvas elements (`<canvas>`).
@@ -23,6 +29,7 @@ class CanvasElement(BaseHTMLElement):
     <canvas id="myCanvas" height="400" width="400"></canvas>
 
     """
+    __slots__ = ()
 
     def __init__(
             self,
@@ -44,9 +51,10 @@ class CanvasElement(BaseHTMLElement):
             Optional keyword arguments inherited from the BaseHTMLElement parent class, such as 'content'.
 
         """
-        super().__init__("canvas", height=height, width=width, **kwargs)
+        _base_init(self, "canvas", height=height, width=width, **kwargs)
 
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class CaptionElement(BaseHTMLElement):
     """
     CaptionElement Class extends BaseHTMLElement to represent HTML caption elements (`<caption>`).
@@ -61,6 +69,8 @@ class CaptionElement(BaseHTMLElement):
     --------
     to_string():
         Converts the caption element to an HTML string.
+    interned(content):
+        Returns a shared, read-only caption element for frequently repeated content.
 
     Example Usage:
     --------------
@@ -69,6 +79,7 @@ class CaptionElement(BaseHTMLElement):
     <caption>Table Title</caption>
 
     """
+    __slots__ = ()
 
     def __init__(self, **kwargs) -> None:
         """
@@ -78,9 +89,10 @@ class CaptionElement(BaseHTMLElement):
             Optional keyword arguments inherited from the BaseHTMLElement parent class, such as 'content'.
 
         """
-        super().__init__("caption", **kwargs)
+        _base_init(self, "caption", **kwargs)
 
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class CiteElement(BaseHTMLElement):
     """
     CiteElement Class extends BaseHTMLElement to represent HTML cite elements (`<cite>`).
@@ -95,6 +107,8 @@ class CiteElement(BaseHTMLElement):
     --------
     to_string():
         Converts the cite element to an HTML string.
+    interned(content):
+        Returns a shared, read-only cite element for frequently repeated content.
 
     Example Usage:
     --------------
@@ -103,6 +117,7 @@ class CiteElement(BaseHTMLElement):
     <cite>The Origin of Species</cite>
 
     """
+    __slots__ = ()
 
     def __init__(self, **kwargs) -> None:
         """
@@ -112,9 +127,10 @@ class CiteElement(BaseHTMLElement):
             Optional keyword arguments inherited from the BaseHTMLElement parent class, such as 'content'.
 
         """
-        super().__init__("cite", **kwargs)
+        _base_init(self, "cite", **kwargs)
 
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class CodeElement(BaseHTMLElement):
     """
     CodeElement Class extends BaseHTMLElement to represent HTML code elements (`<code>`).
@@ -129,6 +145,8 @@ class CodeElement(BaseHTMLElement):
     --------
     to_string():
         Converts the code element to an HTML string.
+    interned(content):
+        Returns a shared, read-only code element for frequently repeated content.
 
     Example Usage:
     --------------
@@ -137,6 +155,7 @@ class CodeElement(BaseHTMLElement):
     <code>print('Hello, World!')</code>
 
     """
+    __slots__ = ()
 
     def __init__(self, **kwargs) -> None:
         """
@@ -146,9 +165,10 @@ class CodeElement(BaseHTMLElement):
             Optional keyword arguments inherited from the BaseHTMLElement parent class, such as 'content'.
 
         """
-        super().__init__("code", **kwargs)
+        _base_init(self, "code", **kwargs)
 
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class ColumnElement(BaseHTMLElement):
     """
     ColumnElement Class extends BaseHTMLElement to represent HTML column elements (`<col>`).
@@ -171,7 +191,11 @@ class ColumnElement(BaseHTMLElement):
     >>> print(col_elem.to_string())
     <col span="2">
 
+    Tables that emit many plain columns can share one read-only instance through
+    ColumnElement.interned() instead of creating a new element each time.
+
     """
+    __slots__ = ()
 
     def __init__(self, span: str = None, **kwargs) -> None:
         """
@@ -186,9 +210,12 @@ class ColumnElement(BaseHTMLElement):
             Optional keyword arguments inherited from the BaseHTMLElement parent class, such as 'content'.
 
         """
-        super().__init__("col", span=span, **kwargs)
+        if span is not None:
+            kwargs["span"] = span
+        _base_init(self, "col", **kwargs)
 
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class ColumnGroupElement(BaseHTMLElement):
     """
     ColumnGroupElement Class extends BaseHTMLElement to represent HTML column group elements (`<colgroup>`).
@@ -213,6 +240,7 @@ class ColumnGroupElement(BaseHTMLElement):
     <colgroup span="2">
 
     """
+    __slots__ = ()
 
     def __init__(self, span: str = None, **kwargs) -> None:
         """
@@ -227,4 +255,6 @@ class ColumnGroupElement(BaseHTMLElement):
             Optional keyword arguments inherited from the BaseHTMLElement parent class, such as 'content'.
 
         """
-        super().__init__("colgroup", span=span, **kwargs)
+        if span is not None:
+            kwargs["span"] = span
+        _base_init(self, "colgroup", **kwargs)
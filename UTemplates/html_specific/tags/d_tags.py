@@ -1,6 +1,12 @@
-from ..base import BaseHTMLElement
+from ..base import (BaseHTMLElement, _extract_attributes)
+from ...general_base import mypyc_attr
 
 
+# The tag classes call the base initialiser directly; their only base is BaseHTMLElement.
+_base_init = BaseHTMLElement.__init__
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
 class DataElement(BaseHTMLElement):
     """
     DataElement Class extends BaseHTMLElement to represent HTML data elements (`<data>`).
@@ -23,6 +29,7 @@ class DataElement(BaseHTMLElement):
     <data value="42"></data>
 
     """
+    __slots__ = ()
 
     def __init__(self, value: str = None, **kwargs) -> None:
         """
@@ -37,9 +44,13 @@ class DataElement(BaseHTMLElement):
             Optional keyword arguments inherited from the BaseHTMLElement parent class, such as 'content'.
 
         """
-        super().__init__("data", value=value, **kwargs)
+        attributes: dict[str, any] = _extract_attributes(kwargs)
+        if value is not None:
+            attributes["value"] = value
+        _base_init(self, "data", attributes=attributes, **kwargs)
 
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class DataListElement(BaseHTMLElement):
     """
     DataListElement Class extends BaseHTMLElement to represent HTML datalist elements (`<datalist>`).
@@ -61,6 +72,7 @@ class DataListElement(BaseHTMLElement):
     <datalist></datalist>
 
     """
+    __slots__ = ()
 
     def __init__(self, **kwargs) -> None:
         """
@@ -72,9 +84,10 @@ class DataListElement(BaseHTMLElement):
             Optional keyword arguments inherited from the BaseHTMLElement parent class, such as 'content' or 'attributes'.
 
         """
-        super().__init__("datalist", **kwargs)
+        _base_init(self, "datalist", **kwargs)
 
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class DefinitionDescriptionElement(BaseHTMLElement):
     """
     DefinitionDescriptionElement Class extends BaseHTMLElement to represent HTML definition description elements (`<dd>`).
@@ -96,6 +109,7 @@ class DefinitionDescriptionElement(BaseHTMLElement):
     <dd>This is a description.</dd>
 
     """
+    __slots__ = ()
 
     def __init__(self, **kwargs) -> None:
         """
@@ -107,9 +121,10 @@ class DefinitionDescriptionElement(BaseHTMLElement):
             Optional keyword arguments inherited from the BaseHTMLElement parent class, such as 'content' or 'attributes'.
 
         """
-        super().__init__("dd", **kwargs)
+        _base_init(self, "dd", **kwargs)
 
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class DeletedElement(BaseHTMLElement):
     """
     DeletedElement Class extends BaseHTMLElement to represent HTML deleted text elements (`<del>`).
@@ -131,6 +146,7 @@ class DeletedElement(BaseHTMLElement):
     <del cite="https://example.com" datetime="2023-01-01T12:34:56">deleted content</del>
 
     """
+    __slots__ = ()
 
     def __init__(self, cite: str = None, datetime: str = None, **kwargs) -> None:
         """
@@ -146,9 +162,15 @@ class DeletedElement(BaseHTMLElement):
             Optional keyword arguments inherited from the BaseHTMLElement parent class, such as 'content' or 'attributes'.
 
         """
-        super().__init__("del", cite=cite, datetime=datetime, **kwargs)
+        attributes: dict[str, any] = _extract_attributes(kwargs)
+        if cite is not None:
+            attributes["cite"] = cite
+        if datetime is not None:
+            attributes["datetime"] = datetime
+        _base_init(self, "del", attributes=attributes, **kwargs)
 
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class DetailsElement(BaseHTMLElement):
     """
     DetailsElement Class extends BaseHTMLElement to represent HTML details elements (`<details>`).
@@ -170,6 +192,7 @@ class DetailsElement(BaseHTMLElement):
     <details open>This is some hidden content.</details>
 
     """
+    __slots__ = ()
 
     def __init__(self, open: bool = False, **kwargs) -> None:
         """
@@ -183,9 +206,13 @@ class DetailsElement(BaseHTMLElement):
             Optional keyword arguments inherited from the BaseHTMLElement parent class, such as 'content' or 'attributes'.
 
         """
-        super().__init__("details", open=open, **kwargs)
+        attributes: dict[str, any] = _extract_attributes(kwargs)
+        if open:
+            attributes["open"] = True
+        _base_init(self, "details", attributes=attributes, **kwargs)
 
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class DefinitionElement(BaseHTMLElement):
     """
     DefinitionElement Class extends BaseHTMLElement to represent HTML definition elements (`<dfn>`).
@@ -206,6 +233,7 @@ class DefinitionElement(BaseHTMLElement):
     <dfn>HTML</dfn>
 
     """
+    __slots__ = ()
 
     def __init__(self, **kwargs) -> None:
         """
@@ -217,9 +245,10 @@ class DefinitionElement(BaseHTMLElement):
             Optional keyword arguments inherited from the BaseHTMLElement parent class, such as 'content' or 'attributes'.
 
         """
-        super().__init__("dfn", **kwargs)
+        _base_init(self, "dfn", **kwargs)
 
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class DialogElement(BaseHTMLElement):
     """
     DialogElement Class extends BaseHTMLElement to represent HTML dialog elements (`<dialog>`).
@@ -241,6 +270,7 @@ class DialogElement(BaseHTMLElement):
     <dialog open>Hello, world!</dialog>
 
     """
+    __slots__ = ()
 
     def __init__(self, open: bool = False, **kwargs) -> None:
         """
@@ -255,9 +285,13 @@ class DialogElement(BaseHTMLElement):
             Optional keyword arguments inherited from the BaseHTMLElement parent class, such as 'content' or 'attributes'.
 
         """
-        super().__init__("dialog", open=open, **kwargs)
+        attributes: dict[str, any] = _extract_attributes(kwargs)
+        if open:
+            attributes["open"] = True
+        _base_init(self, "dialog", attributes=attributes, **kwargs)
 
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class DivElement(BaseHTMLElement):
     """
     DivElement Class extends BaseHTMLElement to represent HTML div elements (`<div>`).
@@ -279,6 +313,7 @@ class DivElement(BaseHTMLElement):
     <div>Hello, world!</div>
 
     """
+    __slots__ = ()
 
     def __init__(self, **kwargs) -> None:
         """
@@ -290,9 +325,10 @@ class DivElement(BaseHTMLElement):
             Optional keyword arguments inherited from the BaseHTMLElement parent class, such as 'content', 'attributes', or 'self_closing'.
 
         """
-        super().__init__("div", **kwargs)
+        _base_init(self, "div", **kwargs)
 
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class DescriptionListElement(BaseHTMLElement):
     """
     DescriptionListElement Class extends BaseHTMLElement to represent HTML description list elements (`<dl>`).
@@ -313,6 +349,7 @@ class DescriptionListElement(BaseHTMLElement):
     <dl><dt>Term</dt><dd>Description</dd></dl>
 
     """
+    __slots__ = ()
 
     def __init__(self, **kwargs) -> None:
         """
@@ -324,9 +361,10 @@ class DescriptionListElement(BaseHTMLElement):
             Optional keyword arguments inherited from the BaseHTMLElement parent class, such as 'content', 'attributes', or 'self_closing'.
 
         """
-        super().__init__("dl", **kwargs)
+        _base_init(self, "dl", **kwargs)
 
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class DescriptionTermElement(BaseHTMLElement):
     """
     DescriptionTermElement Class extends BaseHTMLElement to represent HTML description term elements (`<dt>`).
@@ -347,6 +385,7 @@ class DescriptionTermElement(BaseHTMLElement):
     <dt>Apple</dt>
 
     """
+    __slots__ = ()
 
     def __init__(self, **kwargs) -> None:
         """
@@ -358,4 +397,4 @@ class DescriptionTermElement(BaseHTMLElement):
             Optional keyword arguments inherited from the BaseHTMLElement parent class, such as 'content', 'attributes', or 'self_closing'.
 
         """
-        super().__init__("dt", **kwargs)
+        _base_init(self, "dt", **kwargs)
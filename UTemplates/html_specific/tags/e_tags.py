@@ -1,6 +1,12 @@
-from ..base import BaseHTMLElement
+from ..base import (BaseHTMLElement, _extract_attributes)
+from ...general_base import mypyc_attr
 
 
+# The tag classes call the base initialiser directly; their only base is BaseHTMLElement.
+_base_init = BaseHTMLElement.__init__
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
 class EmphasizedElement(BaseHTMLElement):
     """
     EmphasizedElement Class extends BaseHTMLElement to represent HTML emphasized text elements (`<em>`).
@@ -21,6 +27,7 @@ class EmphasizedElement(BaseHTMLElement):
     <em>This is important.</em>
 
     """
+    __slots__ = ()
 
     def __init__(self, **kwargs) -> None:
         """
@@ -32,9 +39,10 @@ class EmphasizedElement(BaseHTMLElement):
             Optional keyword arguments inherited from the BaseHTMLElement parent class, such as 'content', 'attributes', or 'self_closing'.
 
         """
-        super().__init__("em", **kwargs)
+        _base_init(self, "em", **kwargs)
 
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class EmbedElement(BaseHTMLElement):
     """
     EmbedElement Class extends BaseHTMLElement to represent HTML embedded content elements (`<embed>`).
@@ -52,9 +60,10 @@ class EmbedElement(BaseHTMLElement):
     --------------
     >>> embed_elem = EmbedElement(src="video.mp4", type="video/mp4", width="640", height="480")
     >>> print(embed_elem.to_string())
-    <embed src="video.mp4" type="video/mp4" width="640" height="480">
+    <embed height="480" src="video.mp4" type="video/mp4" width="640"/>
 
     """
+    __slots__ = ()
 
     def __init__(
             self, height: str = None, src: str = None, type: str = None, width: str = None, **kwargs
@@ -73,7 +82,16 @@ class EmbedElement(BaseHTMLElement):
         width : str, optional
             Specifies the width of the embedded content.
         **kwargs : dict
-            Optional keyword arguments inherited from the BaseHTMLElement parent class, such as 'content', 'attributes', or 'self_closing'.
+            Optional keyword arguments inherited from the BaseHTMLElement parent class, such as 'attributes'.
 
         """
-        super().__init__("embed", height=height, src=src, type=type, width=width, **kwargs)
+        attributes: dict[str, str] = _extract_attributes(kwargs)
+        if height is not None:
+            attributes["height"] = height
+        if src is not None:
+            attributes["src"] = src
+        if type is not None:
+            attributes["type"] = type
+        if width is not None:
+            attributes["width"] = width
+        _base_init(self, "embed", attributes=attributes, self_closing=True, **kwargs)
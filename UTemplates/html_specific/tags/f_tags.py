@@ -1,6 +1,12 @@
-from ..base import BaseHTMLElement
+from ..base import (BaseHTMLElement, _extract_attributes)
+from ...general_base import mypyc_attr
 
 
+# The tag classes call the base initialiser directly; their only base is BaseHTMLElement.
+_base_init = BaseHTMLElement.__init__
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
 class FieldsetElement(BaseHTMLElement):
     """
     FieldsetElement Class extends BaseHTMLElement to represent HTML fieldset elements (`<fieldset>`).
@@ -21,6 +27,7 @@ class FieldsetElement(BaseHTMLElement):
     <fieldset name="personal_info"></fieldset>
 
     """
+    __slots__ = ()
 
     def __init__(self, disabled: bool = False, form: str = None, name: str = None, **kwargs) -> None:
         """
@@ -38,9 +45,17 @@ class FieldsetElement(BaseHTMLElement):
             Optional keyword arguments inherited from the BaseHTMLElement parent class, such as 'content', 'attributes', or 'self_closing'.
 
         """
-        super().__init__("fieldset", disabled=disabled, form=form, name=name, **kwargs)
+        attributes: dict[str, any] = _extract_attributes(kwargs)
+        if disabled:
+            attributes["disabled"] = True
+        if form is not None:
+            attributes["form"] = form
+        if name is not None:
+            attributes["name"] = name
+        _base_init(self, "fieldset", attributes=attributes, **kwargs)
 
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class FigureCaptionElement(BaseHTMLElement):
     """
     FigureCaptionElement Class extends BaseHTMLElement to represent HTML figure caption elements (`<figcaption>`).
@@ -62,6 +77,7 @@ class FigureCaptionElement(BaseHTMLElement):
     <figcaption>This is a caption.</figcaption>
 
     """
+    __slots__ = ()
 
     def __init__(self, **kwargs) -> None:
         """
@@ -72,9 +88,10 @@ class FigureCaptionElement(BaseHTMLElement):
         **kwargs : dict
             Optional keyword arguments inherited from the BaseHTMLElement parent class, such as 'content', 'attributes', or 'self_closing'.
         """
-        super().__init__("figcaption", **kwargs)
+        _base_init(self, "figcaption", **kwargs)
 
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class FigureElement(BaseHTMLElement):
     """
     FigureElement Class extends BaseHTMLElement to represent HTML figure elements (`<figure>`).
@@ -97,6 +114,7 @@ class FigureElement(BaseHTMLElement):
     <figure><img src="example.jpg" alt="An example image"><figcaption>This is a caption.</figcaption></figure>
 
     """
+    __slots__ = ()
 
     def __init__(self, **kwargs) -> None:
         """
@@ -107,9 +125,10 @@ class FigureElement(BaseHTMLElement):
         **kwargs : dict
             Optional keyword arguments inherited from the BaseHTMLElement parent class, such as 'content', 'attributes', or 'self_closing'.
         """
-        super().__init__("figure", **kwargs)
+        _base_init(self, "figure", **kwargs)
 
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class FooterElement(BaseHTMLElement):
     """
     FooterElement Class extends BaseHTMLElement to represent HTML footer elements (`<footer>`).
@@ -131,6 +150,7 @@ class FooterElement(BaseHTMLElement):
     <footer>Copyright 2023</footer>
 
     """
+    __slots__ = ()
 
     def __init__(self, **kwargs) -> None:
         """
@@ -141,9 +161,10 @@ class FooterElement(BaseHTMLElement):
         **kwargs : dict
             Optional keyword arguments inherited from the BaseHTMLElement parent class, such as 'content', 'attributes', or 'self_closing'.
         """
-        super().__init__("footer", **kwargs)
+        _base_init(self, "footer", **kwargs)
 
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class FormElement(BaseHTMLElement):
     """
     FormElement Class extends BaseHTMLElement to represent HTML form elements (`<form>`).
@@ -166,6 +187,7 @@ class FormElement(BaseHTMLElement):
     <form action="/submit" method="post">Submit your data</form>
 
     """
+    __slots__ = ()
 
     def __init__(
             self,
@@ -207,16 +229,23 @@ class FormElement(BaseHTMLElement):
         **kwargs : dict
             Optional keyword arguments inherited from the BaseHTMLElement parent class, such as 'content', 'attributes', or 'self_closing'.
         """
-        super().__init__(
-            "form",
-            accept_charset=accept_charset,
-            action=action,
-            autocomplete=autocomplete,
-            enctype=enctype,
-            method=method,
-            name=name,
-            novalidate=novalidate,
-            rel=rel,
-            target=target,
-            **kwargs
-        )
+        attributes: dict[str, any] = _extract_attributes(kwargs)
+        if accept_charset is not None:
+            attributes["accept-charset"] = accept_charset
+        if action is not None:
+            attributes["action"] = action
+        if autocomplete is not None:
+            attributes["autocomplete"] = autocomplete
+        if enctype is not None:
+            attributes["enctype"] = enctype
+        if method is not None:
+            attributes["method"] = method
+        if name is not None:
+            attributes["name"] = name
+        if novalidate:
+            attributes["novalidate"] = True
+        if rel is not None:
+            attributes["rel"] = rel
+        if target is not None:
+            attributes["target"] = target
+        _base_init(self, "form", attributes=attributes, **kwargs)
@@ -6,7 +6,7 @@ class GeneralHTMLElement(BaseHTMLElement):
             self,
             tag_name: str,
             attributes: dict[str, any] = None,
-            content: str | BaseHTMLElement | list[str | BaseHTMLElement] = None,
+            content: str | BaseHTMLElement | list[str | BaseHTMLElement] | None = None,
             self_closing: bool = False,
             declaration: bool = False
     ) -> None:
@@ -1,6 +1,16 @@
+from warnings import warn
 from ..base import BaseHTMLElement
+from ...general_base import mypyc_attr
 
 
+# The tag classes call the base initialiser directly; their only base is BaseHTMLElement.
+_base_init = BaseHTMLElement.__init__
+
+# Tag names of the six valid heading levels, indexed by level.
+_HEADING_TAG_NAMES: tuple[str, ...] = ("", "h1", "h2", "h3", "h4", "h5", "h6")
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
 class HeadingElement(BaseHTMLElement):
     """
     HeadingElement Class extends BaseHTMLElement to represent HTML heading elements (`<h1>`, `<h2>`, ..., `<h6>`).
@@ -22,28 +32,36 @@ class HeadingElement(BaseHTMLElement):
     <h1>Main Title</h1>
 
     """
+    __slots__ = ()
 
-    def __init__(self, level: int, **kwargs) -> None:
+    def __init__(self, level: int | float, **kwargs) -> None:
         """
         Initializes a new HeadingElement instance.
 
         Parameters:
         -----------
-        level : int
+        level : int | float
             Specifies the heading level. Valid values are integers from 1 to 6, where 1 corresponds to <h1> and 6 to <h6>.
+            Integral numbers of another type, such as 2.0, are accepted as that level.
 
         **kwargs : dict
             Optional keyword arguments inherited from the BaseHTMLElement parent class, such as 'content', 'attributes', or 'self_closing'.
 
-        Raises:
-        -------
-        Prints a warning message if the provided level is outside of the range 1-6.
+        Warns:
+        ------
+        UserWarning if the provided level is not an integral value in the range 1-6. The check is skipped under python -O.
         """
-        if level > 6 or level < 1:
-            print("WARNING: valid heading elements should be between 1 and 6")
-        super().__init__(f"h{level}", **kwargs)
+        tag_name: str
+        if 1 <= level <= 6 and level == int(level):
+            tag_name = _HEADING_TAG_NAMES[int(level)]
+        else:
+            if __debug__:
+                warn("valid heading elements should be between 1 and 6", stacklevel=2)
+            tag_name = f"h{level}"
+        _base_init(self, tag_name, **kwargs)
 
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class HeadElement(BaseHTMLElement):
     """
     HeadElement Class extends BaseHTMLElement to represent the HTML `<head>` element.
@@ -66,6 +84,7 @@ class HeadElement(BaseHTMLElement):
     <head><title>My Web Page</title><meta charset="UTF-8"></head>
 
     """
+    __slots__ = ()
 
     def __init__(self, **kwargs) -> None:
         """
@@ -77,9 +96,10 @@ class HeadElement(BaseHTMLElement):
             Optional keyword arguments inherited from the BaseHTMLElement parent class,
             such as 'content', 'attributes', or 'self_closing'.
         """
-        super().__init__("head", **kwargs)
+        _base_init(self, "head", **kwargs)
 
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class HeaderElement(BaseHTMLElement):
     """
     HeaderElement Class extends BaseHTMLElement to represent the HTML `<header>` element.
@@ -102,6 +122,7 @@ class HeaderElement(BaseHTMLElement):
     <header><p>Welcome to My Website</p><nav></nav></header>
 
     """
+    __slots__ = ()
 
     def __init__(self, **kwargs) -> None:
         """
@@ -113,9 +134,10 @@ class HeaderElement(BaseHTMLElement):
             Optional keyword arguments inherited from the BaseHTMLElement parent class,
             such as 'content', 'attributes', or 'self_closing'.
         """
-        super().__init__("header", **kwargs)
+        _base_init(self, "header", **kwargs)
 
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class HorizontalRuleElement(BaseHTMLElement):
     """
     HorizontalRuleElement Class extends BaseHTMLElement to represent the HTML `<hr>` element.
@@ -136,7 +158,11 @@ class HorizontalRuleElement(BaseHTMLElement):
     >>> print(hr_elem.to_string())
     <hr />
 
+    Pages that emit many plain rules can share one read-only instance through
+    HorizontalRuleElement.interned() instead of creating a new element each time.
+
     """
+    __slots__ = ()
 
     def __init__(self, **kwargs) -> None:
         """
@@ -148,9 +174,10 @@ class HorizontalRuleElement(BaseHTMLElement):
             Optional keyword arguments inherited from the BaseHTMLElement parent class,
             such as 'attributes'.
         """
-        super().__init__("hr", self_closing=True, **kwargs)
+        _base_init(self, "hr", self_closing=True, **kwargs)
 
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class HTMLElement(BaseHTMLElement):
     """
     HTMLElement Class extends BaseHTMLElement to represent the HTML `<html>` element.
@@ -176,6 +203,7 @@ class HTMLElement(BaseHTMLElement):
     <html xmlns="http://www.w3.org/1999/xhtml"></html>
 
     """
+    __slots__ = ()
 
     def __init__(self, xmlns: str = None, **kwargs) -> None:
         """
@@ -190,4 +218,4 @@ class HTMLElement(BaseHTMLElement):
             Optional keyword arguments inherited from the BaseHTMLElement parent class,
             such as 'attributes'.
         """
-        super().__init__("html", xmlns=xmlns, **kwargs)
+        _base_init(self, "html", xmlns=xmlns, **kwargs)
@@ -1,6 +1,12 @@
-from ..base import BaseHTMLElement
+from ..base import (BaseHTMLElement, _extract_attributes)
+from ...general_base import mypyc_attr
 
 
+# The tag classes call the base initialiser directly; their only base is BaseHTMLElement.
+_base_init = BaseHTMLElement.__init__
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
 class ItalicizedElement(BaseHTMLElement):
     """
     ItalicizedElement Class extends BaseHTMLElement to represent the HTML `<i>` element.
@@ -22,6 +28,7 @@ class ItalicizedElement(BaseHTMLElement):
     >>> print(italic_elem.to_string())
     <i>italic text</i>
     """
+    __slots__ = ()
 
     def __init__(self, **kwargs) -> None:
         """
@@ -33,9 +40,10 @@ class ItalicizedElement(BaseHTMLElement):
             Optional keyword arguments inherited from the BaseHTMLElement parent class,
             such as 'attributes' or 'content'.
         """
-        super().__init__("i", **kwargs)
+        _base_init(self, "i", **kwargs)
 
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class InlineFrameElement(BaseHTMLElement):
     """
     InlineFrameElement Class extends BaseHTMLElement to represent the HTML <iframe> element.
@@ -56,6 +64,7 @@ class InlineFrameElement(BaseHTMLElement):
     >>> print(iframe_elem.to_string())
     <iframe src="https://www.example.com"></iframe>
     """
+    __slots__ = ()
 
     def __init__(
             self,
@@ -103,23 +112,33 @@ class InlineFrameElement(BaseHTMLElement):
             Optional keyword arguments inherited from the BaseHTMLElement parent class,
             such as 'attributes' or 'content'.
         """
-        super().__init__(
-            "iframe",
-            allow=allow,
-            allowfullscreen=allowfullscreen,
-            allowpaymentrequest=allowpaymentrequest,
-            height=height,
-            loading=loading,
-            name=name,
-            referrerpolicy=referrerpolicy,
-            sandbox=sandbox,
-            src=src,
-            srcdoc=srcdoc,
-            width=width,
-            **kwargs
-        )
-
-
+        attributes: dict[str, any] = _extract_attributes(kwargs)
+        if allow is not None:
+            attributes["allow"] = allow
+        if allowfullscreen is not None:
+            attributes["allowfullscreen"] = allowfullscreen
+        if allowpaymentrequest is not None:
+            attributes["allowpaymentrequest"] = allowpaymentrequest
+        if height is not None:
+            attributes["height"] = height
+        if loading is not None:
+            attributes["loading"] = loading
+        if name is not None:
+            attributes["name"] = name
+        if referrerpolicy is not None:
+            attributes["referrerpolicy"] = referrerpolicy
+        if sandbox is not None:
+            attributes["sandbox"] = sandbox
+        if src is not None:
+            attributes["src"] = src
+        if srcdoc is not None:
+            attributes["srcdoc"] = srcdoc
+        if width is not None:
+            attributes["width"] = width
+        _base_init(self, "iframe", attributes=attributes, **kwargs)
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
 class ImageElement(BaseHTMLElement):
     """
     ImageElement Class extends BaseHTMLElement to represent the HTML <img> element.
@@ -133,6 +152,8 @@ class ImageElement(BaseHTMLElement):
     --------
     to_string():
         Converts the HTML element to an HTML string.
+    interned(**kwargs):
+        Returns a shared, read-only img element for frequently repeated attributes.
 
     Example Usage:
     --------------
@@ -140,6 +161,7 @@ class ImageElement(BaseHTMLElement):
     >>> print(img_elem.to_string())
     <img src="image.jpg" alt="Example Image">
     """
+    __slots__ = ()
 
     def __init__(
             self,
@@ -191,23 +213,35 @@ class ImageElement(BaseHTMLElement):
             such as 'attributes' or 'content'.
 
         """
-        super().__init__(
-            "img",
-            alt=alt,
-            crossorigin=crossorigin,
-            height=height,
-            ismap=ismap,
-            loading=loading,
-            longdesc=longdesc,
-            sizes=sizes,
-            src=src,
-            srcset=srcset,
-            usermap=usermap,
-            width=width,
-            **kwargs
-        )
-
-
+        attributes: dict[str, any] = _extract_attributes(kwargs)
+        if alt is not None:
+            attributes["alt"] = alt
+        if crossorigin is not None:
+            attributes["crossorigin"] = crossorigin
+        if height is not None:
+            attributes["height"] = height
+        if ismap:
+            attributes["ismap"] = ismap
+        if loading is not None:
+            attributes["loading"] = loading
+        if longdesc is not None:
+            attributes["longdesc"] = longdesc
+        if referrerpolicy is not None:
+            attributes["referrerpolicy"] = referrerpolicy
+        if sizes is not None:
+            attributes["sizes"] = sizes
+        if src is not None:
+            attributes["src"] = src
+        if srcset is not None:
+            attributes["srcset"] = srcset
+        if usermap is not None:
+            attributes["usermap"] = usermap
+        if width is not None:
+            attributes["width"] = width
+        _base_init(self, "img", attributes=attributes, **kwargs)
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
 class InputElement(BaseHTMLElement):
     """
     InputElement Class extends BaseHTMLElement to represent the HTML <input> element.
@@ -228,6 +262,7 @@ class InputElement(BaseHTMLElement):
     >>> print(input_elem.to_string())
     <input type="text" placeholder="Enter your name">
     """
+    __slots__ = ()
 
     def __init__(
             self,
@@ -333,44 +368,73 @@ class InputElement(BaseHTMLElement):
             Specifies the width of the input element (only for type="image").
         **kwargs : dict
         """
-        super().__init__(
-            "input",
-            accept=accept,
-            alt=alt,
-            autocomplete=autocomplete,
-            autofocus=autofocus,
-            checked=checked,
-            dirname=dirname,
-            disabled=disabled,
-            form=form,
-            formaction=formaction,
-            formenctype=formenctype,
-            formmethod=formmethod,
-            formnovalidate=formnovalidate,
-            formtarget=formtarget,
-            height=height,
-            list=list,
-            max=max,
-            maxlength=maxlength,
-            min=min,
-            minlength=minlength,
-            multiple=multiple,
-            name=name,
-            pattern=pattern,
-            placeholder=placeholder,
-            readonly=readonly,
-            required=required,
-            size=size,
-            src=src,
-            step=step,
-            type=type,
-            value=value,
-            width=width,
-            self_closing=True,
-            **kwargs
-        )
-
-
+        attributes: dict[str, any] = _extract_attributes(kwargs)
+        if accept is not None:
+            attributes["accept"] = accept
+        if alt is not None:
+            attributes["alt"] = alt
+        if autocomplete is not None:
+            attributes["autocomplete"] = autocomplete
+        if autofocus:
+            attributes["autofocus"] = autofocus
+        if checked:
+            attributes["checked"] = checked
+        if dirname is not None:
+            attributes["dirname"] = dirname
+        if disabled:
+            attributes["disabled"] = disabled
+        if form is not None:
+            attributes["form"] = form
+        if formaction is not None:
+            attributes["formaction"] = formaction
+        if formenctype is not None:
+            attributes["formenctype"] = formenctype
+        if formmethod is not None:
+            attributes["formmethod"] = formmethod
+        if formnovalidate is not None:
+            attributes["formnovalidate"] = formnovalidate
+        if formtarget is not None:
+            attributes["formtarget"] = formtarget
+        if height is not None:
+            attributes["height"] = height
+        if list is not None:
+            attributes["list"] = list
+        if max is not None:
+            attributes["max"] = max
+        if maxlength is not None:
+            attributes["maxlength"] = maxlength
+        if min is not None:
+            attributes["min"] = min
+        if minlength is not None:
+            attributes["minlength"] = minlength
+        if multiple:
+            attributes["multiple"] = multiple
+        if name is not None:
+            attributes["name"] = name
+        if pattern is not None:
+            attributes["pattern"] = pattern
+        if placeholder is not None:
+            attributes["placeholder"] = placeholder
+        if readonly:
+            attributes["readonly"] = readonly
+        if required:
+            attributes["required"] = required
+        if size is not None:
+            attributes["size"] = size
+        if src is not None:
+            attributes["src"] = src
+        if step is not None:
+            attributes["step"] = step
+        if type is not None:
+            attributes["type"] = type
+        if value is not None:
+            attributes["value"] = value
+        if width is not None:
+            attributes["width"] = width
+        _base_init(self, "input", attributes=attributes, self_closing=True, **kwargs)
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
 class InsertElement(BaseHTMLElement):
     """
     InsertElement Class extends BaseHTMLElement to represent the HTML <ins> element.
@@ -390,6 +454,7 @@ class InsertElement(BaseHTMLElement):
     >>> print(ins_elem.to_string())
     <ins cite="https://example.com" datetime="2023-01-01T00:00:00Z">Inserted text</ins>
     """
+    __slots__ = ()
 
     def __init__(self, cite: str = None, datetime: str = None, **kwargs) -> None:
         """
@@ -404,4 +469,9 @@ class InsertElement(BaseHTMLElement):
         **kwargs : dict
             Additional keyword arguments that are passed to the parent class.
         """
-        super().__init__("ins", cite=cite, datetime=datetime, **kwargs)
+        attributes: dict[str, any] = _extract_attributes(kwargs)
+        if cite is not None:
+            attributes["cite"] = cite
+        if datetime is not None:
+            attributes["datetime"] = datetime
+        _base_init(self, "ins", attributes=attributes, **kwargs)
@@ -1,6 +1,12 @@
-from ..base import BaseHTMLElement
+from ..base import (BaseHTMLElement, _extract_attributes)
+from ...general_base import mypyc_attr
 
 
+# The tag classes call the base initialiser directly; their only base is BaseHTMLElement.
+_base_init = BaseHTMLElement.__init__
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
 class LabelElement(BaseHTMLElement):
     """
     LabelElement Class extends BaseHTMLElement to represent the HTML <label> element.
@@ -21,6 +27,7 @@ class LabelElement(BaseHTMLElement):
     >>> print(label_elem.to_string())
     <label for="username">Username:</label>
     """
+    __slots__ = ()
 
     def __init__(self, for_attribute: str = None, form: str = None, **kwargs) -> None:
         """
@@ -42,14 +49,15 @@ class LabelElement(BaseHTMLElement):
         form : str
             Represents the 'form' HTML attribute to associate the label with a form.
         """
-        attributes: dict[str, str] = {}
-        if kwargs.get("attributes"):
-            attributes.update(kwargs["attributes"])
-            del kwargs["attributes"]
-        attributes['for'] = for_attribute
-        super().__init__("label", form=form, attributes=attributes, **kwargs)
+        attributes: dict[str, str] = _extract_attributes(kwargs)
+        if for_attribute is not None:
+            attributes["for"] = for_attribute
+        if form is not None:
+            attributes["form"] = form
+        _base_init(self, "label", attributes=attributes, **kwargs)
 
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class LegendElement(BaseHTMLElement):
     """
     LegendElement Class extends BaseHTMLElement to represent the HTML <legend> element.
@@ -70,6 +78,7 @@ class LegendElement(BaseHTMLElement):
     >>> print(legend_elem.to_string())
     <legend>Personal Information</legend>
     """
+    __slots__ = ()
 
     def __init__(self, **kwargs) -> None:
         """
@@ -80,9 +89,10 @@ class LegendElement(BaseHTMLElement):
         **kwargs : dict
             Additional keyword arguments that are passed to the parent class.
         """
-        super().__init__("legend", **kwargs)
+        _base_init(self, "legend", **kwargs)
 
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class ListItemElement(BaseHTMLElement):
     """
     ListItemElement Class extends BaseHTMLElement to represent the HTML <li> element.
@@ -103,6 +113,7 @@ class ListItemElement(BaseHTMLElement):
     <li>Apple</li>
 
     """
+    __slots__ = ()
 
     def __init__(self, **kwargs) -> None:
         """
@@ -113,9 +124,10 @@ class ListItemElement(BaseHTMLElement):
         **kwargs : dict
             Additional keyword arguments that are passed to the parent class.
         """
-        super().__init__("li", **kwargs)
+        _base_init(self, "li", **kwargs)
 
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class LinkElement(BaseHTMLElement):
     """
     LinkElement Class extends BaseHTMLElement to represent the HTML <link> element.
@@ -129,6 +141,8 @@ class LinkElement(BaseHTMLElement):
     --------
     to_string():
         Converts the HTML element to an HTML string.
+    interned(**kwargs):
+        Returns a shared, read-only link element for frequently repeated attributes.
 
     Example Usage:
     --------------
@@ -137,6 +151,7 @@ class LinkElement(BaseHTMLElement):
     <link rel="stylesheet" href="/styles.css">
 
     """
+    __slots__ = ()
 
     def __init__(
             self,
@@ -178,16 +193,21 @@ class LinkElement(BaseHTMLElement):
             Additional keyword arguments that are passed to the parent class.
 
         """
-        super().__init__(
-            "link",
-            crossorigin=crossorigin,
-            href=href,
-            hreflang=hreflang,
-            media=media,
-            referrerpolicy=referrerpolicy,
-            rel=rel,
-            sizes=sizes,
-            title=title,
-            type=type,
-            **kwargs
-        )
+        attributes: dict[str, any] = _extract_attributes(kwargs)
+        if crossorigin:
+            attributes["crossorigin"] = crossorigin
+        if href is not None:
+            attributes["href"] = href
+        if hreflang is not None:
+            attributes["hreflang"] = hreflang
+        if media is not None:
+            attributes["media"] = media
+        if referrerpolicy is not None:
+            attributes["referrerpolicy"] = referrerpolicy
+        if rel is not None:
+            attributes["rel"] = rel
+        if sizes is not None:
+            attributes["sizes"] = sizes
+        if type is not None:
+            attributes["type"] = type
+        _base_init(self, "link", attributes=attributes, title=title, **kwargs)
@@ -1,6 +1,12 @@
-from ..base import BaseHTMLElement
+from ..base import (BaseHTMLElement, _extract_attributes)
+from ...general_base import mypyc_attr
 
 
+# The tag classes call the base initialiser directly; their only base is BaseHTMLElement.
+_base_init = BaseHTMLElement.__init__
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
 class MainElement(BaseHTMLElement):
     """
     MainElement Class extends BaseHTMLElement to represent the HTML <main> element.
@@ -23,6 +29,7 @@ class MainElement(BaseHTMLElement):
     <main>This is the main content.</main>
 
     """
+    __slots__ = ()
 
     def __init__(self, **kwargs) -> None:
         """
@@ -34,9 +41,10 @@ class MainElement(BaseHTMLElement):
             Additional keyword arguments that are passed to the parent class.
 
         """
-        super().__init__("main", **kwargs)
+        _base_init(self, "main", **kwargs)
 
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class MapElement(BaseHTMLElement):
     """
     MapElement Class extends BaseHTMLElement to represent the HTML <map> element.
@@ -60,6 +68,7 @@ class MapElement(BaseHTMLElement):
     <map name="myMap"><area shape="rect" coords="34,44,270,350" href="#"><area shape="circle" coords="128,128,100" href="#"></map>
 
     """
+    __slots__ = ()
 
     def __init__(self, name: str, **kwargs) -> None:
         """
@@ -73,9 +82,13 @@ class MapElement(BaseHTMLElement):
             Additional keyword arguments that are passed to the parent class.
 
         """
-        super().__init__("map", name=name, **kwargs)
+        attributes: dict[str, any] = _extract_attributes(kwargs)
+        if name is not None:
+            attributes["name"] = name
+        _base_init(self, "map", attributes=attributes, **kwargs)
 
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class MarkedElement(BaseHTMLElement):
     """
     MarkedElement Class extends BaseHTMLElement to represent the HTML <mark> element.
@@ -98,6 +111,7 @@ class MarkedElement(BaseHTMLElement):
     <mark>Important</mark>
 
     """
+    __slots__ = ()
 
     def __init__(self, **kwargs) -> None:
         """
@@ -109,9 +123,10 @@ class MarkedElement(BaseHTMLElement):
             Additional keyword arguments that are passed to the parent class.
 
         """
-        super().__init__("mark", **kwargs)
+        _base_init(self, "mark", **kwargs)
 
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class MetaElement(BaseHTMLElement):
     """
     MetaElement Class extends BaseHTMLElement to represent the HTML <meta> element.
@@ -126,6 +141,8 @@ class MetaElement(BaseHTMLElement):
     --------
     to_string():
         Converts the HTML element to an HTML string.
+    interned(**kwargs):
+        Returns a shared, read-only meta element for frequently repeated attributes.
 
     Example Usage:
     --------------
@@ -134,6 +151,7 @@ class MetaElement(BaseHTMLElement):
     <meta charset="UTF-8" name="viewport" content="width=device-width, initial-scale=1.0">
 
     """
+    __slots__ = ()
 
     def __init__(
             self, charset: str = None, content: str = None, http_equiv: str = None, name: str = None, **kwargs
@@ -156,11 +174,17 @@ class MetaElement(BaseHTMLElement):
             Additional keyword arguments that are passed to the parent class.
 
         """
-        super().__init__(
-            "meta", charset=charset, content=content, http_equiv=http_equiv, name=name, self_closing=True, **kwargs
-        )
+        attributes: dict[str, any] = _extract_attributes(kwargs)
+        if charset is not None:
+            attributes["charset"] = charset
+        if http_equiv is not None:
+            attributes["http-equiv"] = http_equiv
+        if name is not None:
+            attributes["name"] = name
+        _base_init(self, "meta", attributes=attributes, content=content, self_closing=True, **kwargs)
 
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class MeterElement(BaseHTMLElement):
     """
     MeterElement Class extends BaseHTMLElement to represent the HTML <meter> element.
@@ -182,6 +206,7 @@ class MeterElement(BaseHTMLElement):
     <meter value="75" min="0" max="100" low="25" high="90" optimum="80">
 
     """
+    __slots__ = ()
 
     def __init__(
             self,
@@ -218,6 +243,19 @@ class MeterElement(BaseHTMLElement):
             Additional keyword arguments that are passed to the parent class.
 
         """
-        super().__init__(
-            "meter", form=form, high=high, low=low, max=max, min=min, optimum=optimum, value=value, **kwargs
-        )
+        attributes: dict[str, any] = _extract_attributes(kwargs)
+        if form is not None:
+            attributes["form"] = form
+        if high is not None:
+            attributes["high"] = high
+        if low is not None:
+            attributes["low"] = low
+        if max is not None:
+            attributes["max"] = max
+        if min is not None:
+            attributes["min"] = min
+        if optimum is not None:
+            attributes["optimum"] = optimum
+        if value is not None:
+            attributes["value"] = value
+        _base_init(self, "meter", attributes=attributes, **kwargs)
@@ -1,4 +1,4 @@
-from ..base import BaseHTMLElement
+from ..base import (BaseHTMLElement, _extract_attributes)
 
 
 class ObjectElement(BaseHTMLElement):
@@ -244,9 +244,6 @@ class OutputElement(BaseHTMLElement):
             Additional keyword arguments that are passed to the parent class.
 
         """
-        attributes: dict[str, str] = {}
-        if kwargs.get("attributes"):
-            attributes.update(kwargs["attributes"])
-            del kwargs["attributes"]
+        attributes: dict[str, str | None] = _extract_attributes(kwargs)
         attributes['for'] = for_attribute
         super().__init__("output", form=form, name=name, attributes=attributes, **kwargs)
@@ -1,4 +1,4 @@
-from ..base import BaseHTMLElement
+from ..base import (BaseHTMLElement, _extract_attributes)
 
 
 class ParagraphElement(BaseHTMLElement):
@@ -22,6 +22,7 @@ class ParagraphElement(BaseHTMLElement):
     <p>This is a paragraph of text.</p>
 
     """
+    __slots__ = ()
 
     def __init__(self, **kwargs) -> None:
         """
@@ -56,6 +57,7 @@ class ParameterElement(BaseHTMLElement):
     <param name="autoplay" value="true" />
 
     """
+    __slots__ = ()
 
     def __init__(self, name: str = None, value: str = None, **kwargs) -> None:
         """
@@ -71,7 +73,12 @@ class ParameterElement(BaseHTMLElement):
             Additional keyword arguments that are passed to the parent class.
 
         """
-        super().__init__("param", name=name, value=value, self_closing=True, **kwargs)
+        attributes: dict[str, any] = _extract_attributes(kwargs)
+        if name is not None:
+            attributes["name"] = name
+        if value is not None:
+            attributes["value"] = value
+        super().__init__("param", attributes=attributes, self_closing=True, **kwargs)
 
 
 class PictureElement(BaseHTMLElement):
@@ -101,6 +108,7 @@ class PictureElement(BaseHTMLElement):
     </picture>
 
     """
+    __slots__ = ()
 
     def __init__(self, **kwargs) -> None:
         """
@@ -141,6 +149,7 @@ class PreformattedElement(BaseHTMLElement):
     </pre>
 
     """
+    __slots__ = ()
 
     def __init__(self, **kwargs) -> None:
         """
@@ -176,6 +185,7 @@ class ProgressElement(BaseHTMLElement):
     <progress max="100" value="60"></progress>
 
     """
+    __slots__ = ()
 
     def __init__(self, max: str = "1", value: str = None, **kwargs) -> None:
         """
@@ -192,4 +202,9 @@ class ProgressElement(BaseHTMLElement):
             Additional keyword arguments that are passed to the parent class.
 
         """
-        super().__init__("progress", max=max, value=value, **kwargs)
+        attributes: dict[str, any] = _extract_attributes(kwargs)
+        if max is not None:
+            attributes["max"] = max
+        if value is not None:
+            attributes["value"] = value
+        super().__init__("progress", attributes=attributes, **kwargs)
@@ -1,4 +1,4 @@
-from ..base import BaseHTMLElement
+from ..base import (BaseHTMLElement, _extract_attributes)
 
 
 class QuotationElement(BaseHTMLElement):
@@ -37,4 +37,7 @@ class QuotationElement(BaseHTMLElement):
             Additional keyword arguments that are passed to the parent class.
 
         """
-        super().__init__("q", cite=cite, **kwargs)
+        attributes: dict[str, any] = _extract_attributes(kwargs)
+        if cite is not None:
+            attributes["cite"] = cite
+        super().__init__("q", attributes=attributes, **kwargs)
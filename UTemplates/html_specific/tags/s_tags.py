@@ -1,4 +1,4 @@
-from ..base import BaseHTMLElement
+from ..base import (BaseHTMLElement, _extract_attributes)
 
 
 class StruckThroughElement(BaseHTMLElement):
@@ -25,6 +25,7 @@ class StruckThroughElement(BaseHTMLElement):
     <s></s>
 
     """
+    __slots__ = ()
 
     def __init__(self, **kwargs) -> None:
         """
@@ -63,6 +64,7 @@ class SampleElement(BaseHTMLElement):
     <samp></samp>
 
     """
+    __slots__ = ()
 
     def __init__(self, **kwargs) -> None:
         """
@@ -101,6 +103,7 @@ class ScriptElement(BaseHTMLElement):
     <script src="myscript.js" type="text/javascript"></script>
 
     """
+    __slots__ = ()
 
     def __init__(
             self,
@@ -140,22 +143,24 @@ class ScriptElement(BaseHTMLElement):
             Additional keyword arguments that are passed to the parent class.
 
         """
-        attributes: dict[str, str | bool] = {}
-        if kwargs.get("attributes"):
-            attributes.update(kwargs["attributes"])
-            del kwargs["attributes"]
-        attributes['async'] = async_attribute
-        super().__init__(
-            "script",
-            crossorigin=crossorigin,
-            defer=defer,
-            integrity=integrity,
-            nomodule=nomodule,
-            referrerpolicy=referrerpolicy,
-            src=src,
-            type=type,
-            **kwargs
-        )
+        attributes: dict[str, any] = _extract_attributes(kwargs)
+        if async_attribute:
+            attributes["async"] = async_attribute
+        if crossorigin is not None:
+            attributes["crossorigin"] = crossorigin
+        if defer:
+            attributes["defer"] = defer
+        if integrity is not None:
+            attributes["integrity"] = integrity
+        if nomodule is not None:
+            attributes["nomodule"] = nomodule
+        if referrerpolicy is not None:
+            attributes["referrerpolicy"] = referrerpolicy
+        if src is not None:
+            attributes["src"] = src
+        if type is not None:
+            attributes["type"] = type
+        super().__init__("script", attributes=attributes, **kwargs)
 
 
 class SectionElement(BaseHTMLElement):
@@ -182,6 +187,7 @@ class SectionElement(BaseHTMLElement):
     <section></section>
 
     """
+    __slots__ = ()
 
     def __init__(self, **kwargs) -> None:
         """
@@ -227,6 +233,7 @@ class SelectElement(BaseHTMLElement):
     </select>
 
     """
+    __slots__ = ()
 
     def __init__(
             self,
@@ -263,17 +270,22 @@ class SelectElement(BaseHTMLElement):
             Additional keyword arguments that are passed to the parent class.
 
         """
-        super().__init__(
-            "select",
-            autofocus=autofocus,
-            disabled=disabled,
-            form=form,
-            multiple=multiple,
-            name=name,
-            required=required,
-            size=size,
-            **kwargs
-        )
+        attributes: dict[str, any] = _extract_attributes(kwargs)
+        if autofocus:
+            attributes["autofocus"] = autofocus
+        if disabled:
+            attributes["disabled"] = disabled
+        if form is not None:
+            attributes["form"] = form
+        if multiple:
+            attributes["multiple"] = multiple
+        if name is not None:
+            attributes["name"] = name
+        if required:
+            attributes["required"] = required
+        if size is not None:
+            attributes["size"] = size
+        super().__init__("select", attributes=attributes, **kwargs)
 
 
 class SmallElement(BaseHTMLElement):
@@ -300,6 +312,7 @@ class SmallElement(BaseHTMLElement):
     <small>This is small text.</small>
 
     """
+    __slots__ = ()
 
     def __init__(self, **kwargs) -> None:
         """
@@ -362,6 +375,7 @@ class SourceElement(BaseHTMLElement):
     <source media="(min-width: 768px)" sizes="100vw" srcset="image.jpg 1024w, image-small.jpg 320w" type="image/jpeg">
 
     """
+    __slots__ = ()
 
     def __init__(
             self, media: str = None, sizes: str = None, src: str = None, srcset: str = None, type: str = None, **kwargs
@@ -390,7 +404,18 @@ class SourceElement(BaseHTMLElement):
             Additional keyword arguments that are passed to the parent class.
 
         """
-        super().__init__("source", media=media, sizes=sizes, src=src, srcset=srcset, type=type, **kwargs)
+        attributes: dict[str, any] = _extract_attributes(kwargs)
+        if media is not None:
+            attributes["media"] = media
+        if sizes is not None:
+            attributes["sizes"] = sizes
+        if src is not None:
+            attributes["src"] = src
+        if srcset is not None:
+            attributes["srcset"] = srcset
+        if type is not None:
+            attributes["type"] = type
+        super().__init__("source", attributes=attributes, **kwargs)
 
 
 class SpanElement(BaseHTMLElement):
@@ -423,6 +448,7 @@ class SpanElement(BaseHTMLElement):
     <span>This is a styled span.</span>
 
     """
+    __slots__ = ()
 
     def __init__(self, **kwargs) -> None:
         """
@@ -466,6 +492,7 @@ class StrongElement(BaseHTMLElement):
     <strong>This is important.</strong>
 
     """
+    __slots__ = ()
 
     def __init__(self, **kwargs) -> None:
         """
@@ -515,6 +542,7 @@ class StyleElement(BaseHTMLElement):
     <style type="text/css">body { background-color: lightblue; }</style>
 
     """
+    __slots__ = ()
 
     def __init__(self, media: str = None, type: str = None, **kwargs) -> None:
         """
@@ -531,7 +559,12 @@ class StyleElement(BaseHTMLElement):
             Additional keyword arguments that are passed to the parent class.
 
         """
-        super().__init__("style", media=media, type=type, **kwargs)
+        attributes: dict[str, any] = _extract_attributes(kwargs)
+        if media is not None:
+            attributes["media"] = media
+        if type is not None:
+            attributes["type"] = type
+        super().__init__("style", attributes=attributes, **kwargs)
 
 
 class SubscriptElement(BaseHTMLElement):
@@ -564,6 +597,7 @@ class SubscriptElement(BaseHTMLElement):
     <sub>H2O</sub>
 
     """
+    __slots__ = ()
 
     def __init__(self, **kwargs) -> None:
         """
@@ -609,6 +643,7 @@ class SummaryElement(BaseHTMLElement):
     <summary>More Info</summary>
 
     """
+    __slots__ = ()
 
     def __init__(self, **kwargs) -> None:
         """
@@ -653,6 +688,7 @@ class SuperscriptElement(BaseHTMLElement):
     <sup>2</sup>
 
     """
+    __slots__ = ()
 
     def __init__(self, **kwargs) -> None:
         """
@@ -700,6 +736,7 @@ class SVGElement(BaseHTMLElement):
     </svg>
 
     """
+    __slots__ = ()
 
     def __init__(self, **kwargs) -> None:
         """
@@ -33,7 +33,7 @@ def render(
     """
     if isinstance(html_content, (str, GeneralBaseElement)):
         html_content: list[str | GeneralBaseElement] = [html_content]
-    return str(GroupedBaseElement(elements=html_content))
+    return GroupedBaseElement(elements=html_content).to_string()
 
 
 def save_to_file(html_str: str, file_path: any) -> None:
@@ -34,5 +34,5 @@ def convert_value(value: any, conversion_functions_list: list = None) -> any:
     conversion_functions: list = ConfigurationManager.get_conversion_functions() \
         if conversion_functions_list is None else conversion_functions_list
     for func in conversion_functions:
-        value: any = func(value)
+        value = func(value)
     return value
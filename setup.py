@@ -1,10 +1,35 @@
+import os
 from setuptools import setup, find_packages
 
+# Modules compiled to C extensions with mypyc when UTEMPLATES_USE_MYPYC=1 is set at build time.
+# The pure-Python sources are used otherwise.
+MYPYC_MODULES: list[str] = [
+    "UTemplates/general_base.py",
+    "UTemplates/html_specific/base.py",
+    "UTemplates/html_specific/boilderplate_pages.py",
+    "UTemplates/html_specific/tags/a_tags.py",
+    "UTemplates/html_specific/tags/c_tags.py",
+    "UTemplates/html_specific/tags/d_tags.py",
+    "UTemplates/html_specific/tags/e_tags.py",
+    "UTemplates/html_specific/tags/f_tags.py",
+    "UTemplates/html_specific/tags/h_tags.py",
+    "UTemplates/html_specific/tags/i_tags.py",
+    "UTemplates/html_specific/tags/l_tags.py",
+    "UTemplates/html_specific/tags/m_tags.py",
+]
+
+ext_modules: list = []
+if os.environ.get("UTEMPLATES_USE_MYPYC") == "1":
+    from mypyc.build import mypycify
+    # Type checking options are read from the [tool.mypy] section of pyproject.toml.
+    ext_modules = mypycify(MYPYC_MODULES)
+
 setup(
     name="utemplates",
     version="0.26",
     packages=find_packages(),
     install_requires=[],
+    ext_modules=ext_modules,
     author="Yidi Sprei",
     author_email="yididev@gmail.com",
     description="A Python Templating Framework to allow templating logic to be programmed in python.",